@@ -0,0 +1,217 @@
+"""Batch entry point that runs the Parkinson's analysis pipeline over many raw datasets.
+
+Each raw file is cleaned, analyzed, trained on and plotted by `main.run_pipeline` in its own
+output directory. Datasets are processed concurrently in a bounded process pool, failures are
+isolated to the dataset that raised them and retried, and a consolidated summary table with
+throughput in datasets per minute is written at the end.
+
+Usage:
+    python batch_main.py "exports/*.data" --workers 4 --retries 2
+    python batch_main.py --manifest nightly_manifest.txt
+"""
+
+import argparse
+import glob
+import logging
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+import matplotlib
+
+matplotlib.use("Agg")  # Workers never display plots, so use a non-interactive backend
+
+import pandas as pd
+
+from main import run_pipeline
+
+# ---- CONFIGURATION ----
+BATCH_OUTPUT_ROOT = os.path.join("outputs", "batch")  # One sub-directory per dataset is created here
+SUMMARY_FILENAME = "batch_summary.csv"
+DEFAULT_RETRIES = 1  # Number of extra attempts for a dataset that failed
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def discover_datasets(patterns: list[str], manifest_path: str | None = None) -> list[str]:
+    """Expands glob patterns and an optional manifest file into a list of raw dataset paths.
+
+    Args:
+        patterns (list[str]): Glob patterns or plain paths of raw datasets.
+        manifest_path (str | None, optional): A text file with one path or glob pattern per line.
+            - Empty lines and lines starting with '#' are ignored. Default is None.
+
+    Returns:
+        list[str]: The matching paths, without duplicates, in the order they were found.
+    """
+    all_patterns = list(patterns)
+    if manifest_path is not None:
+        with open(manifest_path) as file:
+            for line in file:
+                entry = line.strip()
+                if entry and not entry.startswith("#"):
+                    all_patterns.append(entry)
+
+    paths = []
+    for pattern in all_patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if os.path.isfile(pattern) else [])
+        if not matches:
+            logging.warning(f"No datasets matched: {pattern}")
+        paths.extend(matches)
+
+    return list(dict.fromkeys(paths))
+
+
+def assign_output_dirs(paths: list[str], output_root: str) -> dict[str, str]:
+    """Assigns a unique output directory under `output_root` to every dataset.
+
+    Args:
+        paths (list[str]): The raw dataset paths.
+        output_root (str): The directory in which per-dataset directories are created.
+
+    Returns:
+        dict[str, str]: A mapping from dataset path to its output directory.
+            - Datasets that share a file name get a numeric suffix (e.g. 'night_2').
+    """
+    output_dirs = {}
+    used_names = set()
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        candidate, suffix = name, 1
+        while candidate in used_names:
+            suffix += 1
+            candidate = f"{name}_{suffix}"
+        used_names.add(candidate)
+        output_dirs[path] = os.path.join(output_root, candidate)
+    return output_dirs
+
+
+def process_dataset(raw_data_path: str, output_dir: str) -> dict:
+    """Runs the full pipeline for one dataset inside a worker process.
+
+    Any exception is caught and reported in the returned record, so one bad dataset
+    does not affect the others in the batch.
+
+    Args:
+        raw_data_path (str): Path to the raw dataset.
+        output_dir (str): Directory for the cleaned data and plots of this dataset.
+
+    Returns:
+        dict: A summary record with the status, row count, duration and error message (if any).
+    """
+    start = time.perf_counter()
+    record = {"dataset": raw_data_path, "output_dir": output_dir, "status": "ok", "rows": 0, "error": ""}
+    try:
+        results = run_pipeline(
+            raw_data_path=raw_data_path,
+            output_dir=output_dir,
+            cleaned_data_path=os.path.join(output_dir, "cleaned_data.csv"),
+            show_plots=False,
+        )
+        record["rows"] = len(results["data"])
+    except Exception as error:  # noqa: BLE001 - failures are isolated per dataset
+        record["status"] = "failed"
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def run_batch(
+    paths: list[str], output_root: str, max_workers: int | None = None, retries: int = DEFAULT_RETRIES
+) -> pd.DataFrame:
+    """Processes many datasets concurrently in a bounded process pool.
+
+    Args:
+        paths (list[str]): The raw dataset paths to process.
+        output_root (str): The directory in which per-dataset output directories are created.
+        max_workers (int | None, optional): The maximum number of worker processes.
+            - None uses the number of CPUs. Default is None.
+        retries (int, optional): How many times a failed dataset is retried. Default is DEFAULT_RETRIES.
+
+    Returns:
+        pd.DataFrame: The consolidated summary table with one row per dataset.
+    """
+    output_dirs = assign_output_dirs(paths, output_root)
+    attempts = dict.fromkeys(paths, 0)
+    records = {}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(path: str) -> Future:
+            attempts[path] += 1
+            return executor.submit(process_dataset, path, output_dirs[path])
+
+        pending = {submit(path): path for path in paths}
+        while pending:
+            for future in as_completed(list(pending)):
+                path = pending.pop(future)
+                try:
+                    record = future.result()
+                except Exception as error:  # noqa: BLE001 - e.g. a worker process that died
+                    record = {
+                        "dataset": path,
+                        "output_dir": output_dirs[path],
+                        "status": "failed",
+                        "rows": 0,
+                        "error": f"{type(error).__name__}: {error}",
+                        "seconds": 0.0,
+                    }
+
+                if record["status"] != "ok" and attempts[path] <= retries:
+                    logging.warning(f"Retrying {path} (attempt {attempts[path] + 1}): {record['error']}")
+                    try:
+                        pending[submit(path)] = path
+                        continue
+                    except RuntimeError as error:  # The pool is broken or shut down
+                        record["error"] = f"{type(error).__name__}: {error}"
+
+                record["attempts"] = attempts[path]
+                records[path] = record
+                logging.info(f"{record['status'].upper()}: {path} ({record['seconds']:.2f}s)")
+    elapsed = time.perf_counter() - start
+
+    summary = pd.DataFrame(
+        [records[path] for path in paths],
+        columns=["dataset", "output_dir", "status", "attempts", "rows", "seconds", "error"],
+    )
+    throughput = len(paths) / (elapsed / 60) if elapsed > 0 else 0.0
+    summary.attrs["elapsed_seconds"] = elapsed
+    summary.attrs["datasets_per_minute"] = throughput
+    return summary
+
+
+def main() -> None:
+    """Parses the command line, runs the batch and writes the summary table."""
+    parser = argparse.ArgumentParser(description="Run the Parkinson's analysis pipeline over many raw datasets.")
+    parser.add_argument("patterns", nargs="*", help="Glob patterns or paths of raw datasets.")
+    parser.add_argument("--manifest", help="A text file with one dataset path or glob pattern per line.")
+    parser.add_argument("--output-root", default=BATCH_OUTPUT_ROOT, help="Directory for per-dataset outputs.")
+    parser.add_argument("--workers", type=int, default=None, help="Maximum number of worker processes.")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries for a failed dataset.")
+    args = parser.parse_args()
+
+    paths = discover_datasets(args.patterns, args.manifest)
+    if not paths:
+        parser.error("no datasets found")
+
+    logging.info(f"Starting batch of {len(paths)} datasets...")
+    summary = run_batch(paths, args.output_root, max_workers=args.workers, retries=args.retries)
+
+    os.makedirs(args.output_root, exist_ok=True)
+    summary_path = os.path.join(args.output_root, SUMMARY_FILENAME)
+    summary.to_csv(summary_path, index=False)
+
+    failed = (summary["status"] != "ok").sum()
+    table = summary[["dataset", "status", "attempts", "rows", "seconds"]].to_string(index=False)
+    logging.info(f"Batch summary:\n{table}")
+    logging.info(
+        f"Batch completed: {len(summary) - failed} succeeded, {failed} failed in "
+        f"{summary.attrs['elapsed_seconds']:.1f}s ({summary.attrs['datasets_per_minute']:.1f} datasets/min). "
+        f"Summary saved to {summary_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
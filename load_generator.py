@@ -0,0 +1,134 @@
+"""Load generator for the local scoring service in 'src/scoring_service.py'.
+
+Concurrent clients send rows sampled from the raw dataset to the /score endpoint over
+keep-alive connections, then the client-side latency percentiles, the request rate and
+the service's own /metrics are reported.
+
+Usage:
+    python -m src.scoring_service --train parkinsons.data
+    python load_generator.py --clients 32 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.scoring_service import DEFAULT_HOST, DEFAULT_PORT
+
+# ---- CONFIGURATION ----
+RAW_DATA_PATH = "parkinsons.data"  # Rows are sampled from this dataset
+FEATURES = ["MDVP:Fo(Hz)"]
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+async def send_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, payload: dict | None = None
+) -> dict:
+    """Sends one HTTP request on an open connection and returns the parsed JSON response.
+
+    Args:
+        reader (asyncio.StreamReader): The connection's reader.
+        writer (asyncio.StreamWriter): The connection's writer.
+        method (str): The HTTP method.
+        path (str): The endpoint path.
+        payload (dict | None, optional): The JSON body. Default is None.
+
+    Returns:
+        dict: The parsed JSON response.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    await reader.readline()  # Status line
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return json.loads(await reader.readexactly(int(headers["content-length"])))
+
+
+async def run_client(host: str, port: int, rows: list[dict], latencies_ms: list[float]) -> None:
+    """Sends one /score request per row over a single keep-alive connection.
+
+    Args:
+        host (str): The service address.
+        port (int): The service port.
+        rows (list[dict]): The feature rows to send.
+        latencies_ms (list[float]): The list that collects the round-trip latencies.
+
+    Returns:
+        None
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for row in rows:
+            start = time.perf_counter()
+            await send_request(reader, writer, "POST", "/score", {"rows": [row]})
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, clients: int, requests_per_client: int, features: list[str]) -> dict:
+    """Runs concurrent clients against the service and summarizes the results.
+
+    Args:
+        host (str): The service address.
+        port (int): The service port.
+        clients (int): The number of concurrent clients.
+        requests_per_client (int): The number of requests each client sends.
+        features (list[str]): The feature columns sent in each row.
+
+    Returns:
+        dict: Client-side p50/p99 latency, requests per second and the service's own metrics.
+    """
+    dataframe = pd.read_csv(RAW_DATA_PATH).dropna(subset=features)
+    rng = np.random.default_rng(42)
+    indices = rng.integers(0, len(dataframe), size=(clients, requests_per_client))
+    records = dataframe[features].to_dict("records")
+
+    latencies_ms: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_client(host, port, [records[i] for i in client_indices], latencies_ms) for client_indices in indices)
+    )
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        service_metrics = await send_request(reader, writer, "GET", "/metrics")
+    finally:
+        writer.close()
+
+    return {
+        "requests": len(latencies_ms),
+        "requests_per_second": len(latencies_ms) / elapsed,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "service": service_metrics,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate load against the local scoring service.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=32, help="Number of concurrent clients.")
+    parser.add_argument("--requests", type=int, default=100, help="Requests sent by each client.")
+    parser.add_argument("--features", nargs="+", default=FEATURES, help="Feature columns sent in each row.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load(args.host, args.port, args.clients, args.requests, args.features))
+    logging.info(
+        f"{results['requests']} requests at {results['requests_per_second']:.0f} req/s, "
+        f"client p50={results['p50_ms']:.2f}ms p99={results['p99_ms']:.2f}ms"
+    )
+    logging.info(f"Service metrics: {results['service']}")
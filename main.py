@@ -2,12 +2,31 @@
 
 import logging
 import os
+import sys
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from src.data_analysis import logistic_regression_analysis
-from src.data_cleaning import normalize_columns, remove_missing_values, remove_outliers, save_cleaned_data
-from src.data_visualization import create_logistic_regression_plot, plot_correlation_matrix, plot_group_comparison
+from src.data_cleaning import clean_dataset, save_cleaned_data
+from src.data_loading import load_raw_data
+from src.data_visualization import (
+    create_logistic_regression_plot,
+    plot_correlation_heatmap,
+    plot_correlation_matrix,
+    plot_evaluation_curves,
+    plot_group_comparison,
+    save_figure,
+)
+from src.incremental_analysis import (
+    DEFAULT_TOLERANCE,
+    STATE_FILENAME,
+    full_analysis,
+    incremental_analysis,
+    load_state,
+    moments_correlation,
+    save_state,
+)
+from src.memoization import DEFAULT_CACHE_DIR, MemoStore, cached_logistic_regression_analysis
+from src.model_evaluation import evaluate_predictions
 
 # ---- CONFIGURATION ----
 RAW_DATA_PATH = "parkinsons.data"  # Path to the raw dataset
@@ -24,62 +43,101 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
-def clean_data() -> pd.DataFrame:
+def clean_data(raw_data_path: str = RAW_DATA_PATH, cleaned_data_path: str = CLEANED_DATA_PATH) -> pd.DataFrame:
     """Loads, cleans, and saves the dataset.
 
+    Args:
+        raw_data_path (str, optional): Path to the raw dataset. Default is RAW_DATA_PATH.
+        cleaned_data_path (str, optional): Path to save the cleaned dataset. Default is CLEANED_DATA_PATH.
+
     Returns:
         pd.DataFrame: The cleaned dataset.
     """
     logging.info("Loading raw data...")
-    df = pd.read_csv(RAW_DATA_PATH)  # Load raw dataset
+    df = load_raw_data(raw_data_path)  # Load raw dataset, in parallel for large files
 
     logging.info("Cleaning data...")
-    df = remove_missing_values(df)
-    df = normalize_columns(df, NUMERIC_COLUMNS)
-
-    for column in NUMERIC_COLUMNS:
-        df = remove_outliers(df, column)
+    df = clean_dataset(df, NUMERIC_COLUMNS)  # Missing values, normalization and outliers
 
     logging.info("Saving cleaned data...")
-    save_cleaned_data(df, CLEANED_DATA_PATH)  # Save cleaned dataset to a CSV file
+    save_cleaned_data(df, cleaned_data_path)  # Save cleaned dataset to a CSV file
 
-    logging.info("Data cleaning completed. Cleaned dataset saved to cleaned_data.csv")
+    logging.info(f"Data cleaning completed. Cleaned dataset saved to {cleaned_data_path}")
     return df  # Return the cleaned dataset for further analysis
 
 
-def save_plot(fig: plt.Figure, filename: str) -> None:
+def save_plot(fig: plt.Figure, filename: str, output_dir: str = OUTPUT_DIR) -> None:
     """Saves a matplotlib figure to the outputs directory.
 
     Args:
         fig (plt.Figure): The figure to save.
         filename (str): The filename for saving the plot.
+        output_dir (str, optional): The directory to save the plot in. Default is OUTPUT_DIR.
     """
-    if not filename.endswith(".png"):
-        filename += ".png"
-    filename = filename.replace(":", "_")  # Replace invalid characters
-    output_path = os.path.join(OUTPUT_DIR, filename)
-    fig.savefig(output_path, format="png", bbox_inches="tight")
-    logging.info(f"Saved plot: {output_path}")
+    save_figure(fig, filename, output_dir)
 
 
-def main() -> None:
-    """Runs data cleaning, analysis, and visualization."""
-    logging.info("Starting analysis pipeline...")
+def finish_plot(fig: plt.Figure, filename: str, output_dir: str = OUTPUT_DIR, show_plots: bool = True) -> None:
+    """Saves a figure, then displays it or closes it.
+
+    Args:
+        fig (plt.Figure): The figure to save.
+        filename (str): The filename for saving the plot.
+        output_dir (str, optional): The directory to save the plot in. Default is OUTPUT_DIR.
+        show_plots (bool, optional): Whether to display the plot instead of closing it. Default is True.
+    """
+    save_plot(fig, filename, output_dir)
+    if show_plots:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def run_pipeline(
+    raw_data_path: str = RAW_DATA_PATH,
+    output_dir: str = OUTPUT_DIR,
+    cleaned_data_path: str = CLEANED_DATA_PATH,
+    show_plots: bool = True,
+    memo_store: MemoStore | None = None,
+    evaluate: bool = False,
+) -> dict:
+    """Runs data cleaning, analysis, and visualization for a single raw dataset.
+
+    Args:
+        raw_data_path (str, optional): Path to the raw dataset. Default is RAW_DATA_PATH.
+        output_dir (str, optional): Directory where plots are saved. Default is OUTPUT_DIR.
+        cleaned_data_path (str, optional): Path to save the cleaned dataset. Default is CLEANED_DATA_PATH.
+        show_plots (bool, optional): Whether to display each plot after saving it. When False the
+            figures are closed instead, which is what batch runs need. Default is True.
+        memo_store (MemoStore | None, optional): The store of the memoized regression results.
+            - Pass a MemoStore with a cache directory to reuse results across runs. Default is None
+              (the in-memory default store).
+        evaluate (bool, optional): Whether to evaluate the predicted probabilities (ROC, precision-recall,
+            calibration and bootstrap intervals) and save their plot. Default is False.
+
+    Returns:
+        dict: The cleaned dataset under "data", the logistic regression results under "regression"
+            and their evaluation under "evaluation" (None unless evaluate is True).
+            - The regression results (and their model) are shared entries of the memo store, so they
+              should not be modified.
+    """
+    os.makedirs(output_dir, exist_ok=True)
 
     # Step 1: Clean the dataset and save it
-    data = clean_data()  # Load, clean, and save the dataset
+    data = clean_data(raw_data_path, cleaned_data_path)  # Load, clean, and save the dataset
 
     # Step 2: Perform logistic regression analysis
     logging.info("Performing logistic regression...")
-    regression_results = logistic_regression_analysis(data, TARGET_COLUMN, [REGRESSION_FEATURE])
+    regression_results = cached_logistic_regression_analysis(
+        data, TARGET_COLUMN, [REGRESSION_FEATURE], store=memo_store
+    )
 
     # Step 3: Generate visualizations
     logging.info("Generating visualizations...")
 
     # Save and display the correlation matrix
     fig_corr = plot_correlation_matrix(data)
-    save_plot(fig_corr, "correlation_matrix")
-    plt.show()
+    finish_plot(fig_corr, "correlation_matrix", output_dir, show_plots)
 
     # Save and display group comparison plots
     for column in NUMERIC_COLUMNS:
@@ -90,8 +148,7 @@ def main() -> None:
             "healthy_mean": healthy_mean,
             "parkinson_mean": parkinson_mean
         })
-        save_plot(fig_group, f"group_comparison_{column.replace(':', '_')}")
-        plt.show()
+        finish_plot(fig_group, f"group_comparison_{column.replace(':', '_')}", output_dir, show_plots)
 
     # Save and display the logistic regression plot
     fig_reg = create_logistic_regression_plot(
@@ -100,11 +157,109 @@ def main() -> None:
         y_pred_probs=regression_results["y_pred_probs"],
         feature_name=REGRESSION_FEATURE
     )
-    save_plot(fig_reg, "logistic_regression")
-    plt.show()
+    finish_plot(fig_reg, "logistic_regression", output_dir, show_plots)
+
+    # Step 4: Optionally evaluate the predicted probabilities
+    evaluation = None
+    if evaluate:
+        evaluation = evaluate_predictions(regression_results)
+        logging.info(
+            f"ROC AUC: {evaluation['roc']['auc']:.3f}, "
+            f"average precision: {evaluation['precision_recall']['average_precision']:.3f}"
+        )
+        fig_eval = plot_evaluation_curves(evaluation)
+        finish_plot(fig_eval, "evaluation_curves", output_dir, show_plots)
+
+    return {"data": data, "regression": regression_results, "evaluation": evaluation}
+
+
+def run_incremental_pipeline(
+    raw_data_path: str = RAW_DATA_PATH,
+    output_dir: str = OUTPUT_DIR,
+    cleaned_data_path: str = CLEANED_DATA_PATH,
+    show_plots: bool = True,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> dict:
+    """Runs the pipeline on the rows appended to the raw dataset since the previous run.
+
+    The first run, and any run where the new rows shift the Min-Max bounds or the outlier
+    thresholds beyond the tolerance, recomputes everything from the whole file.
+
+    Args:
+        raw_data_path (str, optional): Path to the raw dataset. Default is RAW_DATA_PATH.
+        output_dir (str, optional): Directory where plots and the incremental state are saved. Default is OUTPUT_DIR.
+        cleaned_data_path (str, optional): Path of the cleaned dataset. New cleaned rows are appended to it.
+            Default is CLEANED_DATA_PATH.
+        show_plots (bool, optional): Whether to display each plot after saving it. Default is True.
+        tolerance (float, optional): The allowed shift of the bounds and thresholds, as a fraction of the
+            Min-Max range. Default is DEFAULT_TOLERANCE.
+
+    Returns:
+        dict: The incremental state under "state", the logistic regression results under "regression",
+            and whether everything was recomputed under "full_recompute".
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state_path = os.path.join(output_dir, STATE_FILENAME)
+
+    state = load_state(state_path)
+    update = incremental_analysis(state, raw_data_path, tolerance) if state is not None else None
+    if update is None:
+        logging.info("Recomputing the analysis from the whole dataset...")
+        data, state, regression_results = full_analysis(
+            raw_data_path, NUMERIC_COLUMNS, TARGET_COLUMN, [REGRESSION_FEATURE]
+        )
+        save_cleaned_data(data, cleaned_data_path)
+    else:
+        new_rows, state, regression_results = update
+        logging.info(f"Updated the analysis with {len(new_rows)} new cleaned rows.")
+        new_rows.to_csv(cleaned_data_path, mode="a", header=False, index=False)
+    save_state(state, state_path)
+
+    # Plots are drawn from the stored statistics, without the full dataset
+    fig_corr = plot_correlation_heatmap(moments_correlation(state["moments"], NUMERIC_COLUMNS))
+    finish_plot(fig_corr, "correlation_matrix", output_dir, show_plots)
+
+    for position, column in enumerate(NUMERIC_COLUMNS):
+        fig_group = plot_group_comparison({
+            "column": column,
+            "healthy_mean": state["group_moments"][0]["mean"][position],
+            "parkinson_mean": state["group_moments"][1]["mean"][position],
+        })
+        finish_plot(fig_group, f"group_comparison_{column.replace(':', '_')}", output_dir, show_plots)
+
+    fig_reg = create_logistic_regression_plot(
+        X_test=regression_results["X_test"],
+        y_test=regression_results["y_test"],
+        y_pred_probs=regression_results["y_pred_probs"],
+        feature_name=REGRESSION_FEATURE
+    )
+    finish_plot(fig_reg, "logistic_regression", output_dir, show_plots)
+
+    return {"state": state, "regression": regression_results, "full_recompute": update is None}
 
+
+def main(incremental: bool = False, cache_dir: str | None = None, evaluate: bool = False) -> None:
+    """Runs data cleaning, analysis, and visualization.
+
+    Args:
+        incremental (bool, optional): Whether to only process the rows appended since the previous run.
+            Default is False.
+        cache_dir (str | None, optional): The directory where memoized results are kept between runs.
+            Default is None (results are not written to disk).
+        evaluate (bool, optional): Whether to evaluate the predictions and plot the evaluation curves.
+            Default is False.
+    """
+    logging.info("Starting analysis pipeline...")
+    if incremental:
+        run_incremental_pipeline()
+    else:
+        run_pipeline(memo_store=MemoStore(cache_dir) if cache_dir is not None else None, evaluate=evaluate)
     logging.info("Analysis and visualization completed!")
 
 
 if __name__ == "__main__":
-    main()
+    main(
+        incremental="--incremental" in sys.argv[1:],
+        cache_dir=DEFAULT_CACHE_DIR if "--cache" in sys.argv[1:] else None,
+        evaluate="--evaluate" in sys.argv[1:],
+    )
@@ -10,11 +10,15 @@ It includes functions for:
 The results of these analyses are saved to an output file for further visualization and reporting.
 """
 
+import copy
+
 import pandas as pd
 from scipy.stats import shapiro, ttest_ind
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
 
+from src.data_loading import load_raw_data
+
 # Constants
 ALPHA = 0.05  # Significance level for statistical tests
 STABILITY_COLUMNS = ["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)"]
@@ -89,13 +93,23 @@ def correlation_matrix(dataframe: pd.DataFrame, columns: list[str]) -> pd.DataFr
     return dataframe[columns].corr()
 
 
-def logistic_regression_analysis(dataframe: pd.DataFrame, target: str, features: list[str]) -> dict:
+def logistic_regression_analysis(
+    dataframe: pd.DataFrame,
+    target: str,
+    features: list[str],
+    random_state: int = 42,
+    model: LogisticRegression | None = None,
+) -> dict:
     """Performs logistic regression to predict a binary target variable.
 
     Args:
         dataframe (pd.DataFrame): The input DataFrame.
         target (str): The name of the target column (dependent variable).
         features (list[str]): The list of feature columns (independent variables).
+        random_state (int, optional): The seed of the train/test split. Default is 42.
+        model (LogisticRegression, optional): A previously trained model to warm-start from.
+            - Its coefficients are the starting point of the new fit. A copy is fitted, so the given
+              model is not modified. Default is None (a new model).
 
     Returns:
         dict: A dictionary containing the trained model and prediction-related data.
@@ -103,9 +117,13 @@ def logistic_regression_analysis(dataframe: pd.DataFrame, target: str, features:
     X = dataframe[features]
     y = dataframe[target]
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=random_state)
 
-    model = LogisticRegression()
+    if model is None:
+        model = LogisticRegression()
+    else:
+        model = copy.deepcopy(model)
+        model.set_params(warm_start=True)
     model.fit(X_train, y_train)
 
     y_pred_probs = model.predict_proba(X_test)[:, 1]
@@ -156,7 +174,7 @@ def perform_analysis(dataframe: pd.DataFrame, columns: list[str], alpha: float)
 if __name__ == "__main__":
     # Example usage
     file_path = r"C:\Users\4arie\OneDrive\מסמכים\Project python\project_python_01\cleaned_data.csv"
-    df = pd.read_csv(file_path)
+    df = load_raw_data(file_path)
 
     # Define columns
     analysis_results = perform_analysis(df, STABILITY_COLUMNS, ALPHA)
@@ -4,6 +4,7 @@ Functions included:
 - remove_missing_values: Removes rows with missing values.
 - normalize_columns: Normalizes specified numeric columns.
 - remove_outliers: Identifies and removes outliers based on z-score.
+- clean_dataset: Runs the full cleaning step (missing values, normalization and outliers).
 - encode_categorical_columns: Encodes categorical columns into numeric values.
 """
 
@@ -25,7 +26,9 @@ def remove_missing_values(dataframe: pd.DataFrame) -> pd.DataFrame:
     return dataframe.dropna()
 
 
-def normalize_columns(dataframe: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+def normalize_columns(
+    dataframe: pd.DataFrame, columns: list[str], scaler: MinMaxScaler | None = None
+) -> pd.DataFrame:
     """Normalizes the specified numeric columns using Min-Max Scaling.
 
     Args:
@@ -33,12 +36,19 @@ def normalize_columns(dataframe: pd.DataFrame, columns: list[str]) -> pd.DataFra
             - Only the specified columns will be normalized.
         columns (List[str]): A list of column names to be normalized.
             - The columns should contain numeric data.
+        scaler (MinMaxScaler, optional): The scaler to use. Default is None (a new scaler is fitted).
+            - An unfitted scaler is fitted in place, so the caller can keep it to normalize new data later.
+            - An already fitted scaler is only applied, without refitting.
 
     Returns:
         pd.DataFrame: A new DataFrame where the specified columns are normalized to a range of 0 to 1.
     """
-    scaler = MinMaxScaler()
-    dataframe[columns] = scaler.fit_transform(dataframe[columns])
+    if scaler is None:
+        scaler = MinMaxScaler()
+    if hasattr(scaler, "n_features_in_"):
+        dataframe[columns] = scaler.transform(dataframe[columns])
+    else:
+        dataframe[columns] = scaler.fit_transform(dataframe[columns])
     return dataframe
 
 
@@ -71,6 +81,28 @@ def remove_outliers(dataframe: pd.DataFrame, column: str, z_threshold: float = 3
     return dataframe[rows_to_keep].copy()
 
 
+def clean_dataset(
+    dataframe: pd.DataFrame, columns: list[str], z_threshold: float = 3.0, scaler: MinMaxScaler | None = None
+) -> pd.DataFrame:
+    """Cleans a raw dataset: removes missing values, normalizes the columns and removes their outliers.
+
+    Args:
+        dataframe (pd.DataFrame): The raw input DataFrame. It is not modified.
+        columns (list[str]): The numeric columns to normalize and remove outliers from.
+        z_threshold (float, optional): The z-score threshold of the outlier removal. Default is 3.0.
+        scaler (MinMaxScaler, optional): The scaler passed to 'normalize_columns'. Default is None.
+            - Pass an unfitted scaler to keep the fitted normalization, e.g. to apply it to new data.
+
+    Returns:
+        pd.DataFrame: The cleaned dataset.
+    """
+    dataframe = remove_missing_values(dataframe)  # Returns a new DataFrame, so normalizing does not touch the input
+    dataframe = normalize_columns(dataframe, columns, scaler)
+    for column in columns:
+        dataframe = remove_outliers(dataframe, column, z_threshold)
+    return dataframe
+
+
 
 
 def encode_categorical_columns(dataframe: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
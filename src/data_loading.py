@@ -0,0 +1,118 @@
+"""This module loads raw 'parkinsons.data'-format CSV files using several CPU cores.
+
+Functions included:
+- build_schema: Builds the explicit column types of a raw dataset from its header.
+- split_byte_ranges: Splits the body of a CSV file into byte ranges that start and end on line boundaries.
+- load_raw_data: Parses the byte ranges in parallel worker processes and concatenates the results.
+
+Files smaller than a threshold are loaded with a plain 'pd.read_csv', since starting worker
+processes costs more than it saves for them.
+"""
+
+import io
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Constants
+MIN_PARALLEL_BYTES = 64 * 1024 * 1024  # Files smaller than this are loaded on one core
+TEXT_COLUMNS = {"name": "str"}
+INTEGER_COLUMNS = {"status": "Int64"}  # Nullable, so blank cells are left for the cleaning step
+
+
+def build_schema(columns: list[str]) -> dict[str, str]:
+    """Builds the explicit column types of a raw dataset.
+
+    Args:
+        columns (list[str]): The column names from the file header.
+
+    Returns:
+        dict[str, str]: The dtype of every column. The 'name' column is text, 'status' is a nullable
+            integer and all other columns are float64.
+    """
+    return {column: TEXT_COLUMNS.get(column, INTEGER_COLUMNS.get(column, "float64")) for column in columns}
+
+
+def split_byte_ranges(file_path: str, n_ranges: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """Splits the body of a CSV file into byte ranges that start and end on line boundaries.
+
+    Args:
+        file_path (str): The path of the CSV file.
+        n_ranges (int): The number of ranges to aim for. Fewer are returned for very short files.
+
+    Returns:
+        tuple[list[str], list[tuple[int, int]]]: The header columns and the (start, end) byte offsets of every range.
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "rb") as file:
+        columns = file.readline().decode().strip().split(",")
+        body_start = file.tell()
+
+        boundaries = [body_start]
+        for k in range(1, n_ranges):
+            target = body_start + (file_size - body_start) * k // n_ranges
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()  # Move to the start of the next line
+            if boundaries[-1] < file.tell() < file_size:
+                boundaries.append(file.tell())
+        boundaries.append(file_size)
+
+    return columns, list(zip(boundaries[:-1], boundaries[1:], strict=True))
+
+
+def _parse_range(file_path: str, start: int, end: int, columns: list[str], schema: dict[str, str]) -> pd.DataFrame:
+    """Parses one byte range of a CSV file in a worker process."""
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=schema, engine=CSV_ENGINE)
+
+
+def load_raw_data(
+    file_path: str, max_workers: int | None = None, min_parallel_bytes: int = MIN_PARALLEL_BYTES
+) -> pd.DataFrame:
+    """Loads a raw CSV file, parsing it on several cores when it is large.
+
+    The file is split into byte ranges on line boundaries, each range is parsed in a worker
+    process with an explicit numeric schema (using the pyarrow engine when it is installed),
+    and the parsed ranges are concatenated in file order. The parse rate in MB/s is logged.
+
+    Args:
+        file_path (str): The path of the CSV file.
+        max_workers (int | None, optional): The number of worker processes. Default is None (the number of CPUs).
+        min_parallel_bytes (int, optional): Files smaller than this are loaded with 'pd.read_csv' on one core.
+            Default is MIN_PARALLEL_BYTES.
+
+    Returns:
+        pd.DataFrame: The loaded dataset.
+    """
+    start = time.perf_counter()
+    file_size = os.path.getsize(file_path)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if file_size < min_parallel_bytes or max_workers == 1:
+        dataframe = pd.read_csv(file_path)
+    else:
+        columns, byte_ranges = split_byte_ranges(file_path, max_workers)
+        schema = build_schema(columns)
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(byte_ranges))) as executor:
+            futures = [executor.submit(_parse_range, file_path, s, e, columns, schema) for s, e in byte_ranges]
+            frames = [future.result() for future in futures]
+        dataframe = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    seconds = time.perf_counter() - start
+    megabytes = file_size / (1024 * 1024)
+    logging.info(f"Loaded {len(dataframe)} rows ({megabytes:.1f} MB) in {seconds:.2f}s: {megabytes / seconds:.1f} MB/s")
+    return dataframe
@@ -5,8 +5,13 @@ Functions included:
 - Generating a correlation heatmap for stability and loudness columns.
 - Creating comparative visualizations to analyze differences between healthy individuals and Parkinson's patients.
 - Creating logistic regression visualization for predicted probabilities.
+- Plotting ROC, precision-recall and calibration curves of the predicted probabilities.
+- Saving figures as PNG files.
 """
 
+import logging
+import os
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -23,7 +28,18 @@ def plot_correlation_matrix(dataframe: pd.DataFrame) -> plt.Figure:
         plt.Figure: A matplotlib figure object containing the heatmap.
     """
     corr_matrix = dataframe[["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)"]].corr()
+    return plot_correlation_heatmap(corr_matrix)
+
 
+def plot_correlation_heatmap(corr_matrix: pd.DataFrame) -> plt.Figure:
+    """Creates a heatmap of an already computed correlation matrix.
+
+    Args:
+        corr_matrix (pd.DataFrame): The correlation matrix.
+
+    Returns:
+        plt.Figure: A matplotlib figure object containing the heatmap.
+    """
     # Create the figure
     fig, ax = plt.subplots(figsize=(8, 6))
     sns.heatmap(corr_matrix, annot=True, cmap="coolwarm", fmt=".2f", linewidths=0.5, ax=ax)
@@ -96,3 +112,66 @@ def create_logistic_regression_plot(
 
     return fig
 
+
+def plot_evaluation_curves(evaluation: dict) -> plt.Figure:
+    """Creates ROC, precision-recall and calibration plots side by side.
+
+    Args:
+        evaluation (dict): The results of 'evaluate_predictions' in 'model_evaluation.py'.
+
+    Returns:
+        plt.Figure: A matplotlib figure object containing the three plots.
+    """
+    roc = evaluation["roc"]
+    precision_recall = evaluation["precision_recall"]
+    calibration = evaluation["calibration"]
+
+    # Create the figure
+    fig, (ax_roc, ax_pr, ax_cal) = plt.subplots(1, 3, figsize=(18, 6))
+
+    ax_roc.plot(roc["fpr"], roc["tpr"], color="red", label=f"AUC = {roc['auc']:.3f}")
+    ax_roc.plot([0, 1], [0, 1], color="gray", linestyle="--")
+    ax_roc.set_title("ROC Curve")
+    ax_roc.set_xlabel("False Positive Rate")
+    ax_roc.set_ylabel("True Positive Rate")
+    ax_roc.legend()
+
+    ax_pr.step(
+        precision_recall["recall"],
+        precision_recall["precision"],
+        where="post",
+        color="blue",
+        label=f"AP = {precision_recall['average_precision']:.3f}",
+    )
+    ax_pr.set_title("Precision-Recall Curve")
+    ax_pr.set_xlabel("Recall")
+    ax_pr.set_ylabel("Precision")
+    ax_pr.legend()
+
+    ax_cal.plot(calibration["mean_predicted"], calibration["fraction_positive"], marker="o", color="orange")
+    ax_cal.plot([0, 1], [0, 1], color="gray", linestyle="--")
+    ax_cal.set_title(f"Calibration (ECE = {calibration['ece']:.3f})")
+    ax_cal.set_xlabel("Mean Predicted Probability")
+    ax_cal.set_ylabel("Fraction of Parkinson's Patients")
+
+    return fig
+
+
+def save_figure(fig: plt.Figure, filename: str, output_dir: str) -> str:
+    """Saves a matplotlib figure as a PNG file in the output directory.
+
+    Args:
+        fig (plt.Figure): The figure to save.
+        filename (str): The filename for saving the plot. The '.png' extension is added if missing.
+        output_dir (str): The directory to save the plot in.
+
+    Returns:
+        str: The path of the saved file.
+    """
+    if not filename.endswith(".png"):
+        filename += ".png"
+    filename = filename.replace(":", "_")  # Replace invalid characters
+    output_path = os.path.join(output_dir, filename)
+    fig.savefig(output_path, format="png", bbox_inches="tight")
+    logging.info(f"Saved plot: {output_path}")
+    return output_path
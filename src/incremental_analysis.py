@@ -0,0 +1,343 @@
+"""This module re-analyzes a raw dataset incrementally when new recordings are appended to it.
+
+A full run cleans the whole file like main.py and stores a state with the byte offset and row
+count it processed, the Min-Max bounds, the outlier thresholds, sufficient statistics (count,
+mean, co-moments, min and max) of the cleaned columns overall and per group, and the model.
+The next run reads only the new tail of the file, cleans it with the stored bounds and thresholds,
+merges its statistics into the stored ones and warm-starts the regression. It falls back to a
+full run when the tail moves the Min-Max bounds or the outlier thresholds beyond a tolerance.
+
+Functions included:
+- compute_moments / merge_moments: Sufficient statistics of numeric columns, and their parallel merge.
+- moments_statistics / moments_correlation: Descriptive statistics and correlation from the statistics.
+- full_analysis: Cleans and analyzes the whole file, and returns the state for the next run.
+- incremental_analysis: Updates a state with the new tail of the file, or returns None if a full run is needed.
+- save_state / load_state: Stores the state between runs.
+"""
+
+import io
+import logging
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import MinMaxScaler
+
+from src.data_analysis import logistic_regression_analysis
+from src.data_cleaning import normalize_columns, remove_missing_values, remove_outliers
+from src.data_loading import load_raw_data
+
+# Constants
+STATE_FILENAME = "incremental_state.pkl"
+DEFAULT_TOLERANCE = 0.05  # Allowed shift of the bounds and thresholds, as a fraction of the Min-Max range
+
+
+def compute_moments(values: np.ndarray) -> dict:
+    """Computes the sufficient statistics of the columns of a 2-D array.
+
+    Args:
+        values (np.ndarray): The values, one column per variable.
+
+    Returns:
+        dict: The row count "n", the column means "mean", the co-moment matrix "comoment"
+            (sum of products of deviations), and the column minimums "min" and maximums "max".
+    """
+    n_columns = values.shape[1]
+    if len(values) == 0:
+        return {
+            "n": 0,
+            "mean": np.zeros(n_columns),
+            "comoment": np.zeros((n_columns, n_columns)),
+            "min": np.full(n_columns, np.inf),
+            "max": np.full(n_columns, -np.inf),
+        }
+    mean = values.mean(axis=0)
+    deviations = values - mean
+    return {
+        "n": len(values),
+        "mean": mean,
+        "comoment": deviations.T @ deviations,
+        "min": values.min(axis=0),
+        "max": values.max(axis=0),
+    }
+
+
+def merge_moments(left: dict, right: dict) -> dict:
+    """Merges the sufficient statistics of two disjoint sets of rows (Chan et al.'s parallel algorithm).
+
+    Args:
+        left (dict): The statistics of the first set, from 'compute_moments'.
+        right (dict): The statistics of the second set, from 'compute_moments'.
+
+    Returns:
+        dict: The statistics of the union of both sets.
+    """
+    if left["n"] == 0:
+        return right
+    if right["n"] == 0:
+        return left
+    n = left["n"] + right["n"]
+    delta = right["mean"] - left["mean"]
+    return {
+        "n": n,
+        "mean": left["mean"] + delta * right["n"] / n,
+        "comoment": left["comoment"] + right["comoment"] + np.outer(delta, delta) * left["n"] * right["n"] / n,
+        "min": np.minimum(left["min"], right["min"]),
+        "max": np.maximum(left["max"], right["max"]),
+    }
+
+
+def moments_statistics(moments: dict, columns: list[str]) -> pd.DataFrame:
+    """Returns descriptive statistics from sufficient statistics.
+
+    The quartiles of 'descriptive_statistics' cannot be updated incrementally, so only the
+    count, mean, standard deviation, minimum and maximum are returned.
+
+    Args:
+        moments (dict): The statistics from 'compute_moments' or 'merge_moments'.
+        columns (list[str]): The column names.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the statistics as rows and the columns as columns.
+    """
+    std = np.sqrt(np.diag(moments["comoment"]) / (moments["n"] - 1))
+    return pd.DataFrame(
+        [np.full(len(columns), moments["n"]), moments["mean"], std, moments["min"], moments["max"]],
+        index=["count", "mean", "std", "min", "max"],
+        columns=columns,
+    )
+
+
+def moments_correlation(moments: dict, columns: list[str]) -> pd.DataFrame:
+    """Returns the correlation matrix from sufficient statistics.
+
+    Args:
+        moments (dict): The statistics from 'compute_moments' or 'merge_moments'.
+        columns (list[str]): The column names.
+
+    Returns:
+        pd.DataFrame: The correlation matrix.
+    """
+    scale = np.sqrt(np.diag(moments["comoment"]))
+    return pd.DataFrame(moments["comoment"] / np.outer(scale, scale), index=columns, columns=columns)
+
+
+def _group_moments(dataframe: pd.DataFrame, columns: list[str], target: str) -> dict:
+    """Computes the sufficient statistics of the columns for every value of the target."""
+    return {
+        group: compute_moments(rows[columns].to_numpy(dtype=np.float64))
+        for group, rows in dataframe.groupby(target)
+    }
+
+
+def _reference_thresholds(moments: dict, z_threshold: float) -> np.ndarray:
+    """Returns the (lower, upper) outlier thresholds implied by the statistics of the cleaned rows."""
+    mean = moments["mean"]
+    std = np.sqrt(np.diag(moments["comoment"]) / (moments["n"] - 1))
+    return np.column_stack([mean - z_threshold * std, mean + z_threshold * std])
+
+
+def _stored_regression_results(state: dict) -> dict:
+    """Returns the regression results of the stored model on its test rows, without refitting it."""
+    regression_data, target, features = state["regression_data"], state["target"], state["features"]
+    _, X_test, _, y_test = train_test_split(
+        regression_data[features], regression_data[target], test_size=0.2, random_state=42
+    )
+    return {
+        "model": state["model"],
+        "X_test": X_test,
+        "y_test": y_test,
+        "y_pred_probs": state["model"].predict_proba(X_test)[:, 1],
+    }
+
+
+def full_analysis(
+    raw_data_path: str,
+    columns: list[str],
+    target: str,
+    features: list[str],
+    z_threshold: float = 3.0,
+) -> tuple[pd.DataFrame, dict, dict]:
+    """Cleans and analyzes the whole raw file, and returns the state for later incremental runs.
+
+    The cleaning is the same as in main.py: missing values are removed, the columns are
+    normalized with Min-Max Scaling, and outliers are removed column by column.
+
+    Args:
+        raw_data_path (str): The path of the raw dataset.
+        columns (list[str]): The numeric columns to clean and analyze.
+        target (str): The binary target column.
+        features (list[str]): The feature columns of the regression.
+        z_threshold (float, optional): The z-score threshold of the outlier removal. Default is 3.0.
+
+    Returns:
+        tuple[pd.DataFrame, dict, dict]: The cleaned dataset, the state and the regression results.
+    """
+    byte_offset = os.path.getsize(raw_data_path)
+    with open(raw_data_path, "rb") as file:
+        header = file.readline()
+    dataframe = load_raw_data(raw_data_path)
+    row_count = len(dataframe)
+
+    scaler = MinMaxScaler()
+    dataframe = remove_missing_values(dataframe)
+    dataframe = normalize_columns(dataframe, columns, scaler)
+
+    # Record the thresholds that remove_outliers applies, column by column
+    applied_thresholds = []
+    for column in columns:
+        mean_value = dataframe[column].mean()
+        std_dev = dataframe[column].std()
+        applied_thresholds.append([mean_value - z_threshold * std_dev, mean_value + z_threshold * std_dev])
+        dataframe = remove_outliers(dataframe, column, z_threshold)
+
+    moments = compute_moments(dataframe[columns].to_numpy(dtype=np.float64))
+    regression_results = logistic_regression_analysis(dataframe, target, features)
+
+    state = {
+        "raw_data_path": os.path.abspath(raw_data_path),
+        "header": header,
+        "byte_offset": byte_offset,
+        "row_count": row_count,
+        "columns": list(columns),
+        "target": target,
+        "features": list(features),
+        "z_threshold": z_threshold,
+        "data_min": scaler.data_min_,
+        "data_max": scaler.data_max_,
+        "applied_thresholds": np.array(applied_thresholds),
+        "reference_thresholds": _reference_thresholds(moments, z_threshold),
+        "moments": moments,
+        "group_moments": _group_moments(dataframe, columns, target),
+        "regression_data": dataframe[[*features, target]].reset_index(drop=True),
+        "model": regression_results["model"],
+    }
+    return dataframe, state, regression_results
+
+
+def read_tail(raw_data_path: str, byte_offset: int, header: bytes) -> tuple[pd.DataFrame, int]:
+    """Reads the complete lines appended to a raw file after a byte offset.
+
+    A partially written last line is left for the next run.
+
+    Args:
+        raw_data_path (str): The path of the raw dataset.
+        byte_offset (int): The offset where the previous run stopped.
+        header (bytes): The header line of the file.
+
+    Returns:
+        tuple[pd.DataFrame, int]: The new rows and the offset after the last complete line.
+    """
+    with open(raw_data_path, "rb") as file:
+        file.seek(byte_offset)
+        data = file.read()
+    data = data[: data.rfind(b"\n") + 1]
+    if not data.strip():
+        return pd.read_csv(io.BytesIO(header)), byte_offset
+    return pd.read_csv(io.BytesIO(header + data)), byte_offset + len(data)
+
+
+def incremental_analysis(
+    state: dict, raw_data_path: str, tolerance: float = DEFAULT_TOLERANCE
+) -> tuple[pd.DataFrame, dict, dict] | None:
+    """Updates the analysis with the rows appended to the raw file since the state was saved.
+
+    Args:
+        state (dict): The state from 'full_analysis' or a previous 'incremental_analysis'.
+        raw_data_path (str): The path of the raw dataset.
+        tolerance (float, optional): The allowed shift of the Min-Max bounds and the outlier thresholds,
+            as a fraction of the Min-Max range. Default is DEFAULT_TOLERANCE.
+
+    Returns:
+        tuple[pd.DataFrame, dict, dict] | None: The cleaned new rows, the updated state and the regression
+            results, or None when the file was rewritten or the tail needs a full recompute.
+    """
+    replaced = os.path.abspath(raw_data_path) != state["raw_data_path"]
+    if replaced or os.path.getsize(raw_data_path) < state["byte_offset"]:
+        logging.info("The raw file was replaced, a full recompute is needed.")
+        return None
+    with open(raw_data_path, "rb") as file:
+        if file.readline() != state["header"]:
+            logging.info("The raw file header changed, a full recompute is needed.")
+            return None
+
+    columns, target, features = state["columns"], state["target"], state["features"]
+    tail, byte_offset = read_tail(raw_data_path, state["byte_offset"], state["header"])
+    row_count = state["row_count"] + len(tail)
+    tail = remove_missing_values(tail)
+
+    # The tail must fit in the stored Min-Max bounds, up to the tolerance
+    data_range = state["data_max"] - state["data_min"]
+    if len(tail):
+        tail_values = tail[columns].to_numpy(dtype=np.float64)
+        if np.any(tail_values.min(axis=0) < state["data_min"] - tolerance * data_range) or np.any(
+            tail_values.max(axis=0) > state["data_max"] + tolerance * data_range
+        ):
+            logging.info("The new rows move the Min-Max bounds beyond the tolerance, a full recompute is needed.")
+            return None
+
+    # Normalize with the stored bounds, and remove outliers with the stored thresholds
+    tail[columns] = (tail[columns] - state["data_min"]) / data_range
+    for position, column in enumerate(columns):
+        lower, upper = state["applied_thresholds"][position]
+        tail = tail[(tail[column] >= lower) & (tail[column] <= upper)]
+
+    if not len(tail):
+        logging.info("No new cleaned rows since the last run, the stored model is kept.")
+        return tail, {**state, "byte_offset": byte_offset, "row_count": row_count}, _stored_regression_results(state)
+
+    moments = merge_moments(state["moments"], compute_moments(tail[columns].to_numpy(dtype=np.float64)))
+    shift = np.abs(_reference_thresholds(moments, state["z_threshold"]) - state["reference_thresholds"])
+    if np.any(shift > tolerance):
+        logging.info("The new rows move the outlier thresholds beyond the tolerance, a full recompute is needed.")
+        return None
+
+    group_moments = dict(state["group_moments"])
+    no_rows = compute_moments(np.empty((0, len(columns))))
+    for group, tail_moments in _group_moments(tail, columns, target).items():
+        group_moments[group] = merge_moments(group_moments.get(group, no_rows), tail_moments)
+
+    regression_data = pd.concat([state["regression_data"], tail[[*features, target]]], ignore_index=True)
+    regression_results = logistic_regression_analysis(regression_data, target, features, model=state["model"])
+
+    state = {
+        **state,
+        "byte_offset": byte_offset,
+        "row_count": row_count,
+        "moments": moments,
+        "group_moments": group_moments,
+        "regression_data": regression_data,
+        "model": regression_results["model"],
+    }
+    return tail, state, regression_results
+
+
+def save_state(state: dict, file_path: str) -> None:
+    """Saves the incremental state to a pickle file.
+
+    Args:
+        state (dict): The state to save.
+        file_path (str): The path where the file will be saved.
+
+    Returns:
+        None
+    """
+    with open(file_path, "wb") as file:
+        pickle.dump(state, file)
+
+
+def load_state(file_path: str) -> dict | None:
+    """Loads the incremental state saved by 'save_state'.
+
+    Args:
+        file_path (str): The path of the pickle file.
+
+    Returns:
+        dict | None: The state, or None if no state was saved yet.
+    """
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, "rb") as file:
+        return pickle.load(file)  # noqa: S301
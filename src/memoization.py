@@ -0,0 +1,283 @@
+"""This module memoizes the results of the analysis and training functions.
+
+A result is stored under a key made of the function name, a fast content fingerprint of the
+input columns the function reads, and its other parameters (e.g. alpha, features, target,
+random_state). Results are kept in an in-process LRU and, for stores with a cache directory, in an
+on-disk store whose size is bounded by evicting the least recently used files. Fitted models
+are serialized with pickle. The default store keeps results in memory only.
+
+Functions and classes included:
+- fingerprint_dataframe: Hashes the content, index and types of DataFrame columns.
+- MemoStore: The two-level (memory and disk) result store with hit and miss counters.
+- memoize: Wraps a function so its results are looked up in a MemoStore.
+- cached_perform_analysis / cached_logistic_regression_analysis: Memoized analysis and training functions.
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from src.data_analysis import logistic_regression_analysis, perform_analysis
+
+# Constants
+DEFAULT_CACHE_DIR = ".memo_cache"
+DEFAULT_MAX_MEMORY_ENTRIES = 128
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+
+def fingerprint_dataframe(dataframe: pd.DataFrame, columns: list[str] | None = None) -> str:
+    """Returns a fingerprint of the content, index, names and types of DataFrame columns.
+
+    The values are hashed row-wise by pandas in vectorized code, then the row hashes are
+    digested together, so the cost is one pass over the columns.
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame.
+        columns (list[str] | None, optional): The columns to fingerprint. Default is None (all columns).
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    selected = dataframe if columns is None else dataframe[columns]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(name), str(dtype)) for name, dtype in selected.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(selected, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class MemoStore:
+    """A result store with an in-process LRU in front of a size-bounded on-disk store."""
+
+    def __init__(
+        self,
+        cache_dir: str | None = DEFAULT_CACHE_DIR,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        """Initializes the store.
+
+        Args:
+            cache_dir (str | None, optional): The directory of the on-disk store, created on first write.
+                None keeps results in memory only. Default is DEFAULT_CACHE_DIR.
+            max_memory_entries (int, optional): The number of results kept in memory. Default is
+                DEFAULT_MAX_MEMORY_ENTRIES.
+            max_disk_bytes (int, optional): The maximum total size of the on-disk store. Default is
+                DEFAULT_MAX_DISK_BYTES.
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.memory: OrderedDict[str, Any] = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str | None:
+        """Returns the path of the file that stores a key, or None for a memory-only store."""
+        return None if self.cache_dir is None else os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Looks up a result, first in memory and then on disk.
+
+        Args:
+            key (str): The result key.
+
+        Returns:
+            tuple[bool, Any]: Whether the key was found, and the stored result (or None).
+        """
+        with self._lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+                return True, self.memory[key]
+
+        path = self._path(key)
+        if path is not None:
+            try:
+                with open(path, "rb") as file:
+                    result = pickle.load(file)  # noqa: S301 - only files written by this store
+            except FileNotFoundError:
+                pass
+            except Exception as error:  # noqa: BLE001 - e.g. pickles of older library versions
+                logging.warning(f"Discarding the unreadable memoized result {path}: {error}")
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(path)  # Mark as recently used for the disk eviction
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, result)
+                return True, result
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, result: Any) -> None:  # noqa: ANN401
+        """Stores a result in memory and on disk.
+
+        Args:
+            key (str): The result key.
+            result (Any): The result to store. It must be picklable to be written to disk.
+
+        Returns:
+            None
+        """
+        self._remember(key, result)
+        path = self._path(key)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)  # Readers never see a partially written file
+        self._evict_disk(os.path.dirname(path))
+
+    def _remember(self, key: str, result: Any) -> None:  # noqa: ANN401
+        """Adds a result to the in-process LRU, dropping the least recently used entries."""
+        with self._lock:
+            self.memory[key] = result
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_memory_entries:
+                self.memory.popitem(last=False)
+
+    def _evict_disk(self, cache_dir: str) -> None:
+        """Deletes the least recently used files until the on-disk store fits in max_disk_bytes."""
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes all results from memory and disk, and resets the counters."""
+        with self._lock:
+            self.memory.clear()
+            self.memory_hits = self.disk_hits = self.misses = 0
+        if self.cache_dir is not None and os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".pkl"):
+                    os.remove(entry.path)
+
+    def stats(self) -> dict:
+        """Returns the hit and miss counters.
+
+        Returns:
+            dict: "memory_hits", "disk_hits", "misses" and the "hit_rate".
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+DEFAULT_STORE = MemoStore(cache_dir=None)  # In memory only, so importing this module never writes files
+
+
+def memoize(input_columns: Callable[[dict], list[str]], store: MemoStore | None = None) -> Callable:
+    """Wraps a function whose first argument is a DataFrame so its results are memoized.
+
+    Args:
+        input_columns (Callable[[dict], list[str]]): Returns the DataFrame columns the function reads,
+            given its other arguments by name. Only these columns are fingerprinted.
+        store (MemoStore | None, optional): The store of the results. Default is None (DEFAULT_STORE).
+
+    Returns:
+        Callable: A decorator for the function. The wrapped function also accepts a keyword-only
+            'store' argument that overrides the store for one call, e.g. an on-disk MemoStore.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(
+            dataframe: pd.DataFrame,
+            *args: Any,  # noqa: ANN401
+            store: MemoStore | None = store,
+            **kwargs: Any,  # noqa: ANN401
+        ) -> Any:  # noqa: ANN401
+            arguments = signature.bind(dataframe, *args, **kwargs)
+            arguments.apply_defaults()
+            params = dict(list(arguments.arguments.items())[1:])
+            columns = [column for column in dict.fromkeys(input_columns(params)) if column in dataframe.columns]
+
+            key = hashlib.blake2b(
+                json.dumps(
+                    [function.__module__, function.__qualname__, fingerprint_dataframe(dataframe, columns), params],
+                    sort_keys=True,
+                    default=repr,
+                ).encode(),
+                digest_size=16,
+            ).hexdigest()
+
+            active_store = store if store is not None else DEFAULT_STORE
+            found, result = active_store.get(key)
+            if not found:
+                result = function(dataframe, *args, **kwargs)
+                active_store.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@memoize(lambda params: [*params["columns"], "status"])
+def cached_perform_analysis(dataframe: pd.DataFrame, columns: list[str], alpha: float) -> str:
+    """Memoized 'perform_analysis', keyed on the analyzed columns, 'status' and alpha.
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame.
+        columns (list[str]): List of columns to analyze.
+        alpha (float): The significance level for statistical tests.
+
+    Returns:
+        str: A formatted string with all analysis results.
+    """
+    return perform_analysis(dataframe, columns, alpha)
+
+
+@memoize(lambda params: [*params["features"], params["target"]])
+def cached_logistic_regression_analysis(
+    dataframe: pd.DataFrame, target: str, features: list[str], random_state: int = 42
+) -> dict:
+    """Memoized 'logistic_regression_analysis', keyed on the feature and target columns and random_state.
+
+    The returned dictionary (and its fitted model) is shared between calls, so it should not be modified.
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame.
+        target (str): The name of the target column (dependent variable).
+        features (list[str]): The list of feature columns (independent variables).
+        random_state (int, optional): The seed of the train/test split. Default is 42.
+
+    Returns:
+        dict: A dictionary containing the trained model and prediction-related data.
+    """
+    return logistic_regression_analysis(dataframe, target, features, random_state)
@@ -0,0 +1,212 @@
+"""This module evaluates the predicted probabilities of a binary classifier.
+
+All curves are computed for every threshold at once: the scores are sorted once and the
+true and false positive counts are cumulative sums over the sorted labels, so the cost is
+O(n log n) instead of O(n x thresholds). The functions raise a ValueError when there are no
+predictions, or when a class the metric needs is missing from the labels.
+
+Functions included:
+- roc_curve_points: ROC curve (false and true positive rates) and its AUC.
+- precision_recall_points: Precision-recall curve and average precision.
+- calibration_bins: Mean predicted probability and observed positive rate per probability bin.
+- bootstrap_confidence_intervals: Confidence intervals of the AUC and average precision.
+- evaluate_predictions: Runs all evaluations on the results of a regression analysis.
+"""
+
+import numpy as np
+
+# Constants
+DEFAULT_N_BINS = 10
+DEFAULT_N_BOOTSTRAP = 1000
+MAX_BOOTSTRAP_CELLS = 20_000_000  # Upper bound on (resamples x rows) held in memory at once
+
+
+def _check_labels(y_true: np.ndarray, *, need_positive: bool = True, need_negative: bool = True) -> None:
+    """Raises a ValueError if there are no labels, or if a class the metric needs is missing."""
+    if y_true.size == 0:
+        msg = "No predictions to evaluate."
+        raise ValueError(msg)
+    if need_positive and not np.any(y_true == 1):
+        msg = "The labels contain no positive class, so the metric is undefined."
+        raise ValueError(msg)
+    if need_negative and not np.any(y_true == 0):
+        msg = "The labels contain no negative class, so the metric is undefined."
+        raise ValueError(msg)
+
+
+def _sort_by_score(y_true: np.ndarray, y_score: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sorts by decreasing score and returns the scores, the labels and the last index of every distinct score."""
+    order = np.argsort(y_score, kind="mergesort")[::-1]
+    sorted_scores = y_score[order]
+    threshold_ends = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1]
+    return sorted_scores, y_true[order], threshold_ends
+
+
+def _rates(tps: np.ndarray, fps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Turns cumulative true and false positive counts (last axis) into rates, starting at (0, 0)."""
+    pad = [(0, 0)] * (tps.ndim - 1) + [(1, 0)]
+    tps, fps = np.pad(tps, pad), np.pad(fps, pad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return fps / fps[..., -1:], tps / tps[..., -1:]
+
+
+def _average_precision(tps: np.ndarray, fps: np.ndarray) -> np.ndarray:
+    """Returns the average precision from cumulative true and false positive counts (last axis)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = tps / (tps + fps)
+        recall_steps = np.diff(np.concatenate([np.zeros_like(tps[..., :1]), tps], axis=-1), axis=-1) / tps[..., -1:]
+    return np.sum(recall_steps * np.nan_to_num(precision), axis=-1)
+
+
+def roc_curve_points(y_true: np.ndarray, y_score: np.ndarray) -> dict:
+    """Computes the ROC curve for every threshold and the area under it.
+
+    Args:
+        y_true (np.ndarray): The true binary labels.
+        y_score (np.ndarray): The predicted probabilities of the positive class.
+
+    Returns:
+        dict: "fpr", "tpr" and "thresholds" arrays (one point per distinct score, plus the origin) and "auc".
+    """
+    y_true, y_score = np.asarray(y_true, dtype=np.float64), np.asarray(y_score, dtype=np.float64)
+    _check_labels(y_true)
+    sorted_scores, sorted_labels, threshold_ends = _sort_by_score(y_true, y_score)
+
+    tps = np.cumsum(sorted_labels)[threshold_ends]
+    fps = threshold_ends + 1 - tps
+    fpr, tpr = _rates(tps, fps)
+
+    return {
+        "fpr": fpr,
+        "tpr": tpr,
+        "thresholds": np.r_[np.inf, sorted_scores[threshold_ends]],
+        "auc": float(np.trapezoid(tpr, fpr)),
+    }
+
+
+def precision_recall_points(y_true: np.ndarray, y_score: np.ndarray) -> dict:
+    """Computes the precision-recall curve for every threshold and the average precision.
+
+    Args:
+        y_true (np.ndarray): The true binary labels.
+        y_score (np.ndarray): The predicted probabilities of the positive class.
+
+    Returns:
+        dict: "precision", "recall" and "thresholds" arrays (one point per distinct score) and "average_precision".
+    """
+    y_true, y_score = np.asarray(y_true, dtype=np.float64), np.asarray(y_score, dtype=np.float64)
+    _check_labels(y_true, need_negative=False)
+    sorted_scores, sorted_labels, threshold_ends = _sort_by_score(y_true, y_score)
+
+    tps = np.cumsum(sorted_labels)[threshold_ends]
+    fps = threshold_ends + 1 - tps
+
+    return {
+        "precision": tps / (tps + fps),
+        "recall": tps / tps[-1],
+        "thresholds": sorted_scores[threshold_ends],
+        "average_precision": float(_average_precision(tps, fps)),
+    }
+
+
+def calibration_bins(y_true: np.ndarray, y_score: np.ndarray, n_bins: int = DEFAULT_N_BINS) -> dict:
+    """Groups the predictions into equal-width probability bins and compares them with the observed rate.
+
+    Args:
+        y_true (np.ndarray): The true binary labels.
+        y_score (np.ndarray): The predicted probabilities of the positive class.
+        n_bins (int, optional): The number of bins between 0 and 1. Default is DEFAULT_N_BINS.
+
+    Returns:
+        dict: For the non-empty bins, "bin_edges" (lower edges), "counts", "mean_predicted" and
+            "fraction_positive"; and the expected calibration error "ece".
+    """
+    y_true, y_score = np.asarray(y_true, dtype=np.float64), np.asarray(y_score, dtype=np.float64)
+    _check_labels(y_true, need_positive=False, need_negative=False)
+    bins = np.minimum((y_score * n_bins).astype(np.int64), n_bins - 1)
+
+    counts = np.bincount(bins, minlength=n_bins)
+    non_empty = counts > 0
+    mean_predicted = np.bincount(bins, weights=y_score, minlength=n_bins)[non_empty] / counts[non_empty]
+    fraction_positive = np.bincount(bins, weights=y_true, minlength=n_bins)[non_empty] / counts[non_empty]
+
+    return {
+        "bin_edges": np.arange(n_bins)[non_empty] / n_bins,
+        "counts": counts[non_empty],
+        "mean_predicted": mean_predicted,
+        "fraction_positive": fraction_positive,
+        "ece": float(np.sum(counts[non_empty] * np.abs(fraction_positive - mean_predicted)) / len(y_score)),
+    }
+
+
+def bootstrap_confidence_intervals(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
+    confidence: float = 0.95,
+    random_state: int = 42,
+) -> dict:
+    """Computes bootstrap confidence intervals of the AUC and the average precision.
+
+    Each resample is represented by how many times it draws every row (multinomial weights),
+    so the rows are sorted only once and a batch of resamples is evaluated with weighted
+    cumulative sums along one axis of a 2-D array.
+
+    Args:
+        y_true (np.ndarray): The true binary labels.
+        y_score (np.ndarray): The predicted probabilities of the positive class.
+        n_bootstrap (int, optional): The number of resamples. Default is DEFAULT_N_BOOTSTRAP.
+        confidence (float, optional): The confidence level of the intervals. Default is 0.95.
+        random_state (int, optional): The seed of the resampling. Default is 42.
+
+    Returns:
+        dict: The ("lower", "upper") interval of "auc" and of "average_precision".
+    """
+    y_true, y_score = np.asarray(y_true, dtype=np.float64), np.asarray(y_score, dtype=np.float64)
+    _check_labels(y_true)
+    _, sorted_labels, threshold_ends = _sort_by_score(y_true, y_score)
+
+    n_rows = len(y_score)
+    batch_size = max(1, min(n_bootstrap, MAX_BOOTSTRAP_CELLS // n_rows))
+    rng = np.random.default_rng(random_state)
+    aucs, average_precisions = [], []
+
+    for start in range(0, n_bootstrap, batch_size):
+        weights = rng.multinomial(n_rows, np.full(n_rows, 1 / n_rows), size=min(batch_size, n_bootstrap - start))
+        tps = np.cumsum(weights * sorted_labels, axis=1)[:, threshold_ends]
+        fps = np.cumsum(weights, axis=1)[:, threshold_ends] - tps
+        fpr, tpr = _rates(tps, fps)
+        aucs.append(np.trapezoid(tpr, fpr, axis=1))
+        average_precisions.append(_average_precision(tps, fps))
+
+    quantiles = [(1 - confidence) / 2 * 100, (1 + confidence) / 2 * 100]
+    return {
+        "auc": tuple(np.nanpercentile(np.concatenate(aucs), quantiles).tolist()),
+        "average_precision": tuple(np.nanpercentile(np.concatenate(average_precisions), quantiles).tolist()),
+    }
+
+
+def evaluate_predictions(
+    regression_results: dict, n_bins: int = DEFAULT_N_BINS, n_bootstrap: int = DEFAULT_N_BOOTSTRAP
+) -> dict:
+    """Runs all evaluations on the results of 'logistic_regression_analysis'.
+
+    Args:
+        regression_results (dict): A dictionary with the true labels "y_test" and the predicted
+            probabilities "y_pred_probs".
+        n_bins (int, optional): The number of calibration bins. Default is DEFAULT_N_BINS.
+        n_bootstrap (int, optional): The number of bootstrap resamples, 0 to skip the intervals.
+            Default is DEFAULT_N_BOOTSTRAP.
+
+    Returns:
+        dict: The "roc", "precision_recall" and "calibration" results, and "confidence_intervals" (or None).
+    """
+    y_true = np.asarray(regression_results["y_test"], dtype=np.float64)
+    y_score = np.asarray(regression_results["y_pred_probs"], dtype=np.float64)
+
+    return {
+        "roc": roc_curve_points(y_true, y_score),
+        "precision_recall": precision_recall_points(y_true, y_score),
+        "calibration": calibration_bins(y_true, y_score, n_bins),
+        "confidence_intervals": bootstrap_confidence_intervals(y_true, y_score, n_bootstrap) if n_bootstrap else None,
+    }
@@ -0,0 +1,375 @@
+"""This module describes the analysis pipeline as a DAG of stages and runs it with a concurrent scheduler.
+
+Each stage names a task (a function from the TASKS registry), the stages whose results it takes
+as arguments, and its own parameters. The pipeline is configured from a TOML (or YAML) file
+instead of module constants; see 'pipeline.toml' in the project root for the default pipeline,
+which reproduces main.py.
+
+Functions included:
+- load_pipeline_config: Reads the pipeline settings and stages from a TOML or YAML file.
+- topological_order: Validates the stages and orders them so every stage follows its dependencies.
+- run_dag: Runs independent stages concurrently in threads or processes.
+- critical_path_report: Builds the timing report and marks the stages on the critical path.
+
+Run the pipeline with:
+    python -m src.pipeline_dag pipeline.toml
+"""
+
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+import tomllib
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Any
+
+import matplotlib
+
+matplotlib.use("Agg")  # Stages never display plots, so use a non-interactive backend
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from src.data_analysis import logistic_regression_analysis, perform_analysis
+from src.data_cleaning import clean_dataset, save_cleaned_data
+from src.data_loading import load_raw_data
+from src.data_visualization import (
+    create_logistic_regression_plot,
+    plot_correlation_matrix,
+    plot_evaluation_curves,
+    plot_group_comparison,
+    save_figure,
+)
+from src.model_evaluation import evaluate_predictions
+
+# Constants
+EXECUTORS = ("thread", "process")
+DEFAULT_MAX_WORKERS = 4
+PYPLOT_LOCK = threading.Lock()  # pyplot is not thread-safe, so plotting stages in threads take turns
+
+
+def save_analysis_results(results: str, output_dir: str, filename: str = "analysis_results.txt") -> str:
+    """Saves the text of 'perform_analysis' to a file in the output directory.
+
+    Args:
+        results (str): The analysis results.
+        output_dir (str): The directory to save the file in.
+        filename (str, optional): The name of the file. Default is "analysis_results.txt".
+
+    Returns:
+        str: The path of the saved file.
+    """
+    path = os.path.join(output_dir, filename)
+    with open(path, "w") as file:
+        file.write(results)
+    return path
+
+
+def correlation_plot(dataframe: pd.DataFrame, output_dir: str) -> str:
+    """Creates and saves the correlation matrix heatmap.
+
+    Args:
+        dataframe (pd.DataFrame): The cleaned dataset.
+        output_dir (str): The directory to save the plot in.
+
+    Returns:
+        str: The path of the saved plot.
+    """
+    fig = plot_correlation_matrix(dataframe)
+    path = save_figure(fig, "correlation_matrix", output_dir)
+    plt.close(fig)
+    return path
+
+
+def group_comparison_plots(dataframe: pd.DataFrame, columns: list[str], target: str, output_dir: str) -> list[str]:
+    """Creates and saves a group comparison bar chart for every column.
+
+    Args:
+        dataframe (pd.DataFrame): The cleaned dataset.
+        columns (list[str]): The columns to compare between the groups.
+        target (str): The binary target column (0 = healthy, 1 = Parkinson's).
+        output_dir (str): The directory to save the plots in.
+
+    Returns:
+        list[str]: The paths of the saved plots.
+    """
+    means = dataframe.groupby(target)[columns].mean()
+    paths = []
+    for column in columns:
+        fig = plot_group_comparison({
+            "column": column,
+            "healthy_mean": means.loc[0, column],
+            "parkinson_mean": means.loc[1, column],
+        })
+        paths.append(save_figure(fig, f"group_comparison_{column.replace(':', '_')}", output_dir))
+        plt.close(fig)
+    return paths
+
+
+def regression_plot(regression_results: dict, feature_name: str, output_dir: str) -> str:
+    """Creates and saves the logistic regression plot.
+
+    Args:
+        regression_results (dict): The results of 'logistic_regression_analysis'.
+        feature_name (str): The name of the feature used for the plot.
+        output_dir (str): The directory to save the plot in.
+
+    Returns:
+        str: The path of the saved plot.
+    """
+    fig = create_logistic_regression_plot(
+        X_test=regression_results["X_test"],
+        y_test=regression_results["y_test"],
+        y_pred_probs=regression_results["y_pred_probs"],
+        feature_name=feature_name,
+    )
+    path = save_figure(fig, "logistic_regression", output_dir)
+    plt.close(fig)
+    return path
+
+
+def evaluation_plot(evaluation: dict, output_dir: str) -> str:
+    """Creates and saves the ROC, precision-recall and calibration plots.
+
+    Args:
+        evaluation (dict): The results of 'evaluate_predictions'.
+        output_dir (str): The directory to save the plot in.
+
+    Returns:
+        str: The path of the saved plot.
+    """
+    fig = plot_evaluation_curves(evaluation)
+    path = save_figure(fig, "evaluation_curves", output_dir)
+    plt.close(fig)
+    return path
+
+
+# The tasks a stage can run, by name
+TASKS: dict[str, Callable] = {
+    "load_raw_data": load_raw_data,
+    "clean_dataset": clean_dataset,
+    "save_cleaned_data": save_cleaned_data,
+    "logistic_regression_analysis": logistic_regression_analysis,
+    "perform_analysis": perform_analysis,
+    "save_analysis_results": save_analysis_results,
+    "correlation_plot": correlation_plot,
+    "group_comparison_plots": group_comparison_plots,
+    "regression_plot": regression_plot,
+    "evaluate_predictions": evaluate_predictions,
+    "evaluation_plot": evaluation_plot,
+}
+PYPLOT_TASKS = {"correlation_plot", "group_comparison_plots", "regression_plot", "evaluation_plot"}
+
+
+def load_pipeline_config(file_path: str) -> dict:
+    """Reads the pipeline configuration from a TOML or YAML file.
+
+    The file has a 'scheduler' table (max_workers), a 'settings' table with values shared by all
+    stages (e.g. output_dir), used for every task argument of the same name, and a 'stages' table
+    with one entry per stage:
+    - task (str): The name of the task in TASKS.
+    - inputs (dict, optional): Task argument name -> name of the stage whose result is passed.
+    - params (dict, optional): Task argument name -> value, overriding the settings.
+    - executor (str, optional): "thread" (default, results passed by reference) or "process".
+
+    Args:
+        file_path (str): The path of the .toml, .yaml or .yml file.
+
+    Returns:
+        dict: The configuration, with "settings", "stages" and "max_workers".
+    """
+    if file_path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as error:
+            msg = "Reading a YAML pipeline configuration requires PyYAML (pip install pyyaml)."
+            raise ImportError(msg) from error
+        with open(file_path) as file:
+            config = yaml.safe_load(file)
+    else:
+        with open(file_path, "rb") as file:
+            config = tomllib.load(file)
+
+    return {
+        "settings": config.get("settings", {}),
+        "stages": config.get("stages", {}),
+        "max_workers": config.get("scheduler", {}).get("max_workers", DEFAULT_MAX_WORKERS),
+    }
+
+
+def topological_order(stages: dict, tasks: dict[str, Callable] = TASKS) -> list[str]:
+    """Validates the stages and returns them in an order where every stage follows its dependencies.
+
+    Args:
+        stages (dict): The stages, by name, as described in 'load_pipeline_config'.
+        tasks (dict[str, Callable], optional): The task registry. Default is TASKS.
+
+    Returns:
+        list[str]: The stage names in dependency order.
+    """
+    for name, stage in stages.items():
+        if stage.get("task") not in tasks:
+            msg = f"Stage '{name}' has an unknown task '{stage.get('task')}'."
+            raise ValueError(msg)
+        if stage.get("executor", "thread") not in EXECUTORS:
+            msg = f"Stage '{name}' has an unknown executor '{stage['executor']}'. Expected one of {EXECUTORS}."
+            raise ValueError(msg)
+        for dependency in stage.get("inputs", {}).values():
+            if dependency not in stages:
+                msg = f"Stage '{name}' depends on the unknown stage '{dependency}'."
+                raise ValueError(msg)
+
+    remaining = {name: set(stage.get("inputs", {}).values()) for name, stage in stages.items()}
+    order = []
+    while remaining:
+        ready = sorted(name for name, dependencies in remaining.items() if not dependencies)
+        if not ready:
+            msg = f"The stages {sorted(remaining)} form a dependency cycle."
+            raise ValueError(msg)
+        for name in ready:
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+        order.extend(ready)
+    return order
+
+
+def _stage_arguments(stage: dict, task: Callable, settings: dict, artifacts: dict) -> dict:
+    """Builds the keyword arguments of a stage from the settings, its parameters and its inputs."""
+    parameters = inspect.signature(task).parameters
+    arguments = {key: value for key, value in settings.items() if key in parameters}
+    arguments.update(stage.get("params", {}))
+    arguments.update({argument: artifacts[dependency] for argument, dependency in stage.get("inputs", {}).items()})
+    return arguments
+
+
+def _run_with_lock(task: Callable, lock: threading.Lock, arguments: dict) -> Any:  # noqa: ANN401
+    """Runs a task while holding a lock."""
+    with lock:
+        return task(**arguments)
+
+
+def run_dag(
+    stages: dict, settings: dict | None = None, max_workers: int = DEFAULT_MAX_WORKERS, tasks: dict = TASKS
+) -> tuple[dict, pd.DataFrame]:
+    """Runs the stages, starting every stage as soon as all of its inputs are ready.
+
+    Stages run in a thread pool by default, so results are passed to later stages by reference.
+    Stages with executor = "process" run in a process pool and receive pickled copies instead.
+
+    Args:
+        stages (dict): The stages, by name, as described in 'load_pipeline_config'.
+        settings (dict | None, optional): Values shared by all stages. Default is None.
+        max_workers (int, optional): The number of threads (and processes). Default is DEFAULT_MAX_WORKERS.
+        tasks (dict, optional): The task registry. Default is TASKS.
+
+    Returns:
+        tuple[dict, pd.DataFrame]: The result of every stage, and the timing report from 'critical_path_report'.
+    """
+    settings = settings or {}
+    order = topological_order(stages, tasks)
+    if "output_dir" in settings:
+        os.makedirs(settings["output_dir"], exist_ok=True)
+
+    artifacts: dict = {}
+    timings: dict = {}
+    waiting = {name: set(stages[name].get("inputs", {}).values()) for name in order}
+    running: dict[Future, str] = {}
+    uses_processes = any(stage.get("executor") == "process" for stage in stages.values())
+
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        executors: dict[str, Executor] = {"thread": threads}
+        if uses_processes:
+            executors["process"] = stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+
+        def submit_ready() -> None:
+            for name in [name for name, dependencies in waiting.items() if not dependencies]:
+                del waiting[name]
+                stage = stages[name]
+                task_name = stage["task"]
+                arguments = _stage_arguments(stage, tasks[task_name], settings, artifacts)
+                timings[name] = {"start": time.perf_counter() - start}
+                executor = stage.get("executor", "thread")
+                if executor == "thread" and task_name in PYPLOT_TASKS:
+                    future = threads.submit(_run_with_lock, tasks[task_name], PYPLOT_LOCK, arguments)
+                else:
+                    future = executors[executor].submit(tasks[task_name], **arguments)
+                running[future] = name
+                logging.info(f"Started stage '{name}' ({task_name})")
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                timings[name]["end"] = time.perf_counter() - start
+                try:
+                    artifacts[name] = future.result()
+                except Exception as error:
+                    for other in running:
+                        other.cancel()
+                    msg = f"Stage '{name}' failed: {type(error).__name__}: {error}"
+                    raise RuntimeError(msg) from error
+                logging.info(f"Finished stage '{name}' in {timings[name]['end'] - timings[name]['start']:.3f}s")
+                for dependencies in waiting.values():
+                    dependencies.discard(name)
+            submit_ready()
+
+    return artifacts, critical_path_report(stages, timings)
+
+
+def critical_path_report(stages: dict, timings: dict) -> pd.DataFrame:
+    """Builds the timing report of a run and marks the stages on its critical path.
+
+    The critical path is the chain of stages that determined the total run time: it starts from
+    the stage that finished last and repeatedly follows the input that finished last.
+
+    Args:
+        stages (dict): The stages, by name.
+        timings (dict): The start and end time of every stage, in seconds from the start of the run.
+
+    Returns:
+        pd.DataFrame: One row per stage with its start, end, duration and whether it is on the critical path.
+    """
+    critical_path = []
+    name = max(timings, key=lambda stage_name: timings[stage_name]["end"]) if timings else None
+    while name is not None:
+        critical_path.append(name)
+        dependencies = set(stages[name].get("inputs", {}).values())
+        name = max(dependencies, key=lambda stage_name: timings[stage_name]["end"]) if dependencies else None
+
+    report = pd.DataFrame(
+        [
+            {
+                "stage": stage_name,
+                "start": timing["start"],
+                "end": timing["end"],
+                "seconds": timing["end"] - timing["start"],
+                "critical": stage_name in critical_path,
+            }
+            for stage_name, timing in timings.items()
+        ]
+    )
+    report = report.sort_values("start", ignore_index=True)
+    report.attrs["critical_path"] = critical_path[::-1]
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    config = load_pipeline_config(sys.argv[1] if len(sys.argv) > 1 else "pipeline.toml")
+    _, report = run_dag(config["stages"], config["settings"], config["max_workers"])
+
+    total = report["end"].max()
+    logging.info(
+        f"Pipeline completed in {total:.3f}s (sum of stage times {report['seconds'].sum():.3f}s).\n"
+        f"{report.to_string(index=False)}\n"
+        f"Critical path: {' -> '.join(report.attrs['critical_path'])}"
+    )
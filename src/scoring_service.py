@@ -0,0 +1,402 @@
+"""This module serves online Parkinson's risk scores for new voice recordings.
+
+It includes functions and classes for:
+- Training the scoring artifacts (fitted Min-Max scaler and logistic regression model).
+- Saving and loading the artifacts to and from disk.
+- Scoring many feature rows in one vectorized call.
+- Grouping concurrent requests into micro-batches with a maximum delay.
+- Serving scores over a local HTTP endpoint with p50/p99 latency metrics.
+
+Start the service with:
+    python -m src.scoring_service --train parkinsons.data --artifacts outputs/scoring_artifacts.pkl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import pickle
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import MinMaxScaler
+
+from src.data_analysis import logistic_regression_analysis
+from src.data_cleaning import clean_dataset
+
+# Constants
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH_SIZE = 64  # Maximum number of rows scored in one call
+DEFAULT_MAX_DELAY_MS = 5.0  # Maximum time the first row of a batch waits for more rows
+LATENCY_WINDOW = 10_000  # Number of recent request latencies kept for the percentiles
+NUMERIC_COLUMNS = ["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)"]
+TARGET_COLUMN = "status"
+
+
+def train_scoring_artifacts(
+    dataframe: pd.DataFrame,
+    features: list[str],
+    normalized_columns: list[str] = NUMERIC_COLUMNS,
+    target: str = TARGET_COLUMN,
+) -> dict:
+    """Cleans the dataset the same way as main.py and trains the model used for scoring.
+
+    Args:
+        dataframe (pd.DataFrame): The raw input DataFrame.
+        features (list[str]): The feature columns the model is trained on.
+        normalized_columns (list[str], optional): The columns normalized with Min-Max Scaling.
+            Default is NUMERIC_COLUMNS.
+        target (str, optional): The binary target column. Default is TARGET_COLUMN.
+
+    Returns:
+        dict: The artifacts needed for scoring: "model", "scaler", "normalized_columns" and "features".
+    """
+    scaler = MinMaxScaler()
+    dataframe = clean_dataset(dataframe, normalized_columns, scaler=scaler)
+
+    regression_results = logistic_regression_analysis(dataframe, target, features)
+    return {
+        "model": regression_results["model"],
+        "scaler": scaler,
+        "normalized_columns": list(normalized_columns),
+        "features": list(features),
+    }
+
+
+def save_artifacts(artifacts: dict, file_path: str) -> None:
+    """Saves the scoring artifacts to a pickle file.
+
+    Args:
+        artifacts (dict): The artifacts returned by 'train_scoring_artifacts'.
+        file_path (str): The path where the file will be saved.
+
+    Returns:
+        None
+    """
+    with open(file_path, "wb") as file:
+        pickle.dump(artifacts, file)
+
+
+def load_artifacts(file_path: str) -> dict:
+    """Loads scoring artifacts saved by 'save_artifacts'.
+
+    Args:
+        file_path (str): The path of the pickle file. Only load files you created yourself.
+
+    Returns:
+        dict: The scoring artifacts.
+    """
+    with open(file_path, "rb") as file:
+        return pickle.load(file)  # noqa: S301
+
+
+def feature_transform(artifacts: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the per-feature scale and offset that reproduce the fitted Min-Max normalization.
+
+    Features that were not normalized get a scale of 1 and an offset of 0.
+
+    Args:
+        artifacts (dict): The scoring artifacts.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The scale and offset arrays, aligned with artifacts["features"].
+    """
+    scaler = artifacts["scaler"]
+    positions = {column: index for index, column in enumerate(artifacts["normalized_columns"])}
+    scale = np.ones(len(artifacts["features"]))
+    offset = np.zeros(len(artifacts["features"]))
+    for index, feature in enumerate(artifacts["features"]):
+        if feature in positions:
+            scale[index] = scaler.scale_[positions[feature]]
+            offset[index] = scaler.min_[positions[feature]]
+    return scale, offset
+
+
+def score_rows(artifacts: dict, rows: np.ndarray) -> np.ndarray:
+    """Scores raw feature rows in one vectorized call.
+
+    Args:
+        artifacts (dict): The scoring artifacts.
+        rows (np.ndarray): A 2-D array of raw feature values, with columns in artifacts["features"] order.
+
+    Returns:
+        np.ndarray: The predicted probability of Parkinson's for every row.
+    """
+    if "transform" not in artifacts:
+        artifacts["transform"] = feature_transform(artifacts)
+    scale, offset = artifacts["transform"]
+    normalized = pd.DataFrame(rows * scale + offset, columns=artifacts["features"])
+    return artifacts["model"].predict_proba(normalized)[:, 1]
+
+
+class MicroBatcher:
+    """Groups concurrently submitted rows into batches that are scored together.
+
+    A batch is scored as soon as it holds `max_batch_size` rows, or when its first row
+    has waited `max_delay_ms` milliseconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        artifacts: dict,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+    ) -> None:
+        """Initializes the batcher.
+
+        Args:
+            artifacts (dict): The scoring artifacts.
+            max_batch_size (int, optional): The maximum number of rows per batch. Default is DEFAULT_MAX_BATCH_SIZE.
+            max_delay_ms (float, optional): The maximum wait for a batch to fill. Default is DEFAULT_MAX_DELAY_MS.
+        """
+        self.artifacts = artifacts
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batch_sizes: deque = deque(maxlen=LATENCY_WINDOW)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Starts the background task that scores the batches."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def score(self, row: np.ndarray) -> float:
+        """Submits one row of raw feature values and waits for its score.
+
+        Args:
+            row (np.ndarray): The raw feature values, in artifacts["features"] order.
+
+        Returns:
+            float: The predicted probability of Parkinson's.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((row, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collects rows into batches and scores each batch in one call."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            rows = np.vstack([row for row, _ in batch])
+            self.batch_sizes.append(len(batch))
+            try:
+                scores = score_rows(self.artifacts, rows)
+            except Exception:  # noqa: BLE001 - score the rows one at a time so one bad row fails only its request
+                for row, future in batch:
+                    self._score_one(row, future)
+                continue
+            for (_, future), score in zip(batch, scores, strict=True):
+                if not future.done():
+                    future.set_result(float(score))
+
+    def _score_one(self, row: np.ndarray, future: asyncio.Future) -> None:
+        """Scores a single row and sets its result, or its error, on the waiting future."""
+        if future.done():
+            return
+        try:
+            future.set_result(float(score_rows(self.artifacts, row[np.newaxis, :])[0]))
+        except Exception as error:  # noqa: BLE001 - the error is passed on to the waiting request
+            future.set_exception(error)
+
+
+class ScoringService:
+    """A local HTTP service that scores feature rows through a MicroBatcher.
+
+    Endpoints:
+    - POST /score: body {"rows": [{feature: value, ...}, ...]}, returns {"scores": [...]}.
+    - GET /metrics: returns the request count, mean batch size and p50/p99 latency in milliseconds.
+    - GET /health: returns {"status": "ok"}.
+    """
+
+    def __init__(
+        self,
+        artifacts: dict,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+    ) -> None:
+        """Initializes the service.
+
+        Args:
+            artifacts (dict): The scoring artifacts.
+            max_batch_size (int, optional): The maximum number of rows per batch. Default is DEFAULT_MAX_BATCH_SIZE.
+            max_delay_ms (float, optional): The maximum wait for a batch to fill. Default is DEFAULT_MAX_DELAY_MS.
+        """
+        self.artifacts = artifacts
+        self.batcher = MicroBatcher(artifacts, max_batch_size, max_delay_ms)
+        self.latencies_ms: deque = deque(maxlen=LATENCY_WINDOW)
+        self.request_count = 0
+        self.server: asyncio.Server | None = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+        """Starts listening for connections.
+
+        Args:
+            host (str, optional): The address to bind. Default is DEFAULT_HOST.
+            port (int, optional): The port to bind, 0 picks a free port. Default is DEFAULT_PORT.
+
+        Returns:
+            int: The port the service is listening on.
+        """
+        self.batcher.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self.server = server
+        return server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stops the server and the batcher."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    def metrics(self) -> dict:
+        """Returns the latency and batching metrics of the service.
+
+        Returns:
+            dict: The request count, mean batch size and p50/p99 latency in milliseconds.
+        """
+        latencies = np.array(self.latencies_ms)
+        batch_sizes = np.array(self.batcher.batch_sizes)
+        return {
+            "requests": self.request_count,
+            "mean_batch_size": float(batch_sizes.mean()) if batch_sizes.size else 0.0,
+            "p50_ms": float(np.percentile(latencies, 50)) if latencies.size else 0.0,
+            "p99_ms": float(np.percentile(latencies, 99)) if latencies.size else 0.0,
+        }
+
+    async def score_request(self, body: dict) -> dict:
+        """Scores the rows of one /score request.
+
+        Args:
+            body (dict): The parsed JSON body with a "rows" list of {feature: value} objects.
+
+        Returns:
+            dict: The scores, in the same order as the rows.
+        """
+        features = self.artifacts["features"]
+        rows = [np.array([float(row[feature]) for feature in features]) for row in body["rows"]]
+        for position, row in enumerate(rows):
+            if not np.isfinite(row).all():
+                msg = f"Row {position} has a non-finite feature value (NaN or Infinity)."
+                raise ValueError(msg)
+        scores = await asyncio.gather(*(self.batcher.score(row) for row in rows))
+        return {"scores": list(scores)}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves HTTP/1.1 requests on one keep-alive connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                start = time.perf_counter()
+                status, payload = await self._route(method, path, body)
+                if path == "/score":
+                    self.request_count += 1
+                    self.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[str, dict]:
+        """Dispatches one request to its endpoint and returns the status line and JSON payload."""
+        if method == "POST" and path == "/score":
+            try:
+                return "200 OK", await self.score_request(json.loads(body))
+            except (KeyError, TypeError, ValueError) as error:
+                return "400 Bad Request", {"error": f"{type(error).__name__}: {error}"}
+        if method == "GET" and path == "/metrics":
+            return "200 OK", self.metrics()
+        if method == "GET" and path == "/health":
+            return "200 OK", {"status": "ok"}
+        return "404 Not Found", {"error": f"Unknown endpoint: {method} {path}"}
+
+
+async def serve(artifacts: dict, host: str, port: int, max_batch_size: int, max_delay_ms: float) -> None:
+    """Runs the scoring service until it is interrupted.
+
+    Args:
+        artifacts (dict): The scoring artifacts.
+        host (str): The address to bind.
+        port (int): The port to bind.
+        max_batch_size (int): The maximum number of rows per batch.
+        max_delay_ms (float): The maximum wait for a batch to fill, in milliseconds.
+
+    Returns:
+        None
+    """
+    service = ScoringService(artifacts, max_batch_size, max_delay_ms)
+    port = await service.start(host, port)
+    server = service.server
+    if server is None:
+        msg = "The scoring service did not start a server."
+        raise RuntimeError(msg)
+    logging.info(f"Scoring service listening on http://{host}:{port} (features: {artifacts['features']})")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Serve Parkinson's risk scores over a local HTTP endpoint.")
+    parser.add_argument("--artifacts", default="outputs/scoring_artifacts.pkl", help="Path of the scoring artifacts.")
+    parser.add_argument("--train", help="Raw dataset to train new artifacts from before serving.")
+    parser.add_argument("--features", nargs="+", default=["MDVP:Fo(Hz)"], help="Feature columns used with --train.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY_MS)
+    args = parser.parse_args()
+
+    if args.train:
+        save_artifacts(train_scoring_artifacts(pd.read_csv(args.train), args.features), args.artifacts)
+        logging.info(f"Saved scoring artifacts to {args.artifacts}")
+
+    try:
+        asyncio.run(serve(load_artifacts(args.artifacts), args.host, args.port, args.max_batch_size, args.max_delay_ms))
+    except KeyboardInterrupt:
+        logging.info("Scoring service stopped.")
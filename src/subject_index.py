@@ -0,0 +1,143 @@
+"""This module indexes recording rows by subject for subject-level analysis.
+
+Every row of the dataset is one recording, and the 'name' column ('phon_R01_S<subject>_<n>')
+holds the subject. The index is built once and stores the rows grouped by subject in
+CSR style, so per-subject questions need no string parsing or full scans afterwards.
+
+Functions included:
+- parse_subject_ids: Parses the integer subject IDs from the recording names.
+- build_subject_index: Builds the CSR-style subject index.
+- subject_rows: Returns the row positions of one subject in O(1).
+- aggregate_by_subject: Computes the per-subject mean and standard deviation of numeric columns.
+- subject_train_test_split: Splits the rows into train and test sets without sharing subjects.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Constants
+NAME_COLUMN = "name"
+SUBJECT_PATTERN = r"_S(\d+)_"  # The subject number in 'phon_R01_S<subject>_<n>'
+
+
+def parse_subject_ids(names: pd.Series) -> np.ndarray:
+    """Parses the integer subject IDs from the recording names.
+
+    Args:
+        names (pd.Series): The recording names, e.g. 'phon_R01_S01_1'.
+
+    Returns:
+        np.ndarray: The subject ID of every recording.
+    """
+    subject_ids = names.str.extract(SUBJECT_PATTERN, expand=False)
+    if subject_ids.isna().any():
+        bad_name = names[subject_ids.isna()].iloc[0]
+        msg = f"Cannot parse a subject ID from recording name '{bad_name}'."
+        raise ValueError(msg)
+    return subject_ids.astype(np.int64).to_numpy()
+
+
+def build_subject_index(dataframe: pd.DataFrame, name_column: str = NAME_COLUMN) -> dict:
+    """Builds a CSR-style index of the rows of every subject.
+
+    The rows of subject `subject_ids[i]` are `order[offsets[i]:offsets[i + 1]]`. Row numbers
+    are positions (as used with `iloc`), not index labels.
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame with one recording per row.
+        name_column (str, optional): The column with the recording names. Default is NAME_COLUMN.
+
+    Returns:
+        dict: The index, with keys:
+            - "subject_ids": The sorted unique subject IDs.
+            - "order": The row positions, grouped by subject.
+            - "offsets": The start of every subject's group in "order", plus the total row count.
+            - "positions": A mapping from subject ID to its position in "subject_ids".
+    """
+    row_subjects = parse_subject_ids(dataframe[name_column])
+    order = np.argsort(row_subjects, kind="stable")
+    subject_ids, counts = np.unique(row_subjects[order], return_counts=True)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    return {
+        "subject_ids": subject_ids,
+        "order": order,
+        "offsets": offsets,
+        "positions": {subject_id: position for position, subject_id in enumerate(subject_ids.tolist())},
+    }
+
+
+def subject_rows(index: dict, subject_id: int) -> np.ndarray:
+    """Returns the row positions of one subject.
+
+    Args:
+        index (dict): The index returned by 'build_subject_index'.
+        subject_id (int): The subject ID.
+
+    Returns:
+        np.ndarray: The positions of the subject's rows, usable with `iloc`.
+    """
+    position = index["positions"][subject_id]
+    return index["order"][index["offsets"][position] : index["offsets"][position + 1]]
+
+
+def aggregate_by_subject(dataframe: pd.DataFrame, index: dict, columns: list[str] | None = None) -> pd.DataFrame:
+    """Computes the mean and standard deviation of every column for every subject.
+
+    The groups are reduced with `np.add.reduceat`, in one vectorized pass per statistic.
+    The standard deviation uses ddof=1 like pandas, so it is NaN for subjects with one recording.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame the index was built from.
+        index (dict): The index returned by 'build_subject_index'.
+        columns (list[str] | None, optional): The columns to aggregate. Default is None (all numeric columns).
+
+    Returns:
+        pd.DataFrame: One row per subject, with the recording count and '<column>_mean' and '<column>_std' columns.
+    """
+    if columns is None:
+        columns = dataframe.select_dtypes("number").columns.tolist()
+
+    values = dataframe[columns].to_numpy(dtype=np.float64)[index["order"]]
+    starts = index["offsets"][:-1]
+    counts = np.diff(index["offsets"])
+
+    means = np.add.reduceat(values, starts, axis=0) / counts[:, None]
+    deviations = values - np.repeat(means, counts, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stds = np.sqrt(np.add.reduceat(deviations**2, starts, axis=0) / (counts[:, None] - 1))
+    stds[counts == 1] = np.nan
+
+    result = pd.DataFrame(index=pd.Index(index["subject_ids"], name="subject_id"))
+    result["n_recordings"] = counts
+    for position, column in enumerate(columns):
+        result[f"{column}_mean"] = means[:, position]
+        result[f"{column}_std"] = stds[:, position]
+    return result
+
+
+def subject_train_test_split(
+    dataframe: pd.DataFrame, index: dict, test_size: float = 0.2, random_state: int = 42
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Splits the rows into train and test sets so that no subject appears in both.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame the index was built from.
+        index (dict): The index returned by 'build_subject_index'.
+        test_size (float, optional): The fraction of subjects in the test set. Default is 0.2.
+        random_state (int, optional): The seed used to shuffle the subjects. Default is 42.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The train and test DataFrames.
+    """
+    n_subjects = len(index["subject_ids"])
+    n_test = max(1, round(n_subjects * test_size))
+    test_subjects = np.random.default_rng(random_state).permutation(n_subjects)[:n_test]
+
+    # Mark the CSR groups of the test subjects without looping over rows
+    in_test_group = np.zeros(n_subjects, dtype=bool)
+    in_test_group[test_subjects] = True
+    is_test = np.empty(len(dataframe), dtype=bool)
+    is_test[index["order"]] = np.repeat(in_test_group, np.diff(index["offsets"]))
+
+    return dataframe.iloc[~is_test], dataframe.iloc[is_test]
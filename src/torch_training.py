@@ -0,0 +1,280 @@
+"""This module trains Parkinson's status classifiers with PyTorch on the CPU.
+
+It is an alternative to 'logistic_regression_analysis' in 'data_analysis.py' and includes:
+- Writing the feature and target columns to memory-mapped arrays on disk.
+- Streaming contiguous mini-batches from the memory-mapped arrays through a DataLoader with workers.
+- Training a logistic regression or a small MLP with multi-threaded intra-op parallelism.
+- Comparing the training throughput against the scikit-learn path.
+
+The training function returns the same result dict as 'logistic_regression_analysis'
+("model", "X_test", "y_test", "y_pred_probs"), so the plotting code works unchanged.
+"""
+
+import argparse
+import logging
+import math
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.model_selection import train_test_split
+from torch import nn
+from torch.utils.data import DataLoader, Dataset
+
+from src.data_analysis import logistic_regression_analysis
+
+# Constants
+MODEL_TYPES = ("logistic", "mlp")
+DEFAULT_EPOCHS = 200
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_LEARNING_RATE = 0.05
+DEFAULT_HIDDEN_SIZE = 16
+
+
+class MemmapBatchDataset(Dataset):
+    """A dataset whose items are contiguous mini-batches of memory-mapped feature and target arrays.
+
+    Reading a contiguous slice is a single sequential read, so workers stream batches from disk
+    without loading the whole array. Shuffling happens at the batch level.
+    """
+
+    def __init__(self, features_path: str, target_path: str, batch_size: int) -> None:
+        """Initializes the dataset.
+
+        Args:
+            features_path (str): Path of the .npy file with the float32 feature matrix.
+            target_path (str): Path of the .npy file with the float32 target vector.
+            batch_size (int): The number of rows per batch.
+        """
+        self.features_path = features_path
+        self.target_path = target_path
+        self.batch_size = batch_size
+        self.n_rows = np.load(target_path, mmap_mode="r").shape[0]
+        self._features: np.ndarray | None = None
+        self._target: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Returns the number of batches."""
+        return math.ceil(self.n_rows / self.batch_size)
+
+    def __getitem__(self, index: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Returns the features and targets of one batch."""
+        if self._features is None or self._target is None:
+            # Opened lazily so every worker process maps the files itself
+            self._features = np.load(self.features_path, mmap_mode="r")
+            self._target = np.load(self.target_path, mmap_mode="r")
+        features, target = self._features, self._target
+        rows = slice(index * self.batch_size, (index + 1) * self.batch_size)
+        return torch.from_numpy(np.array(features[rows])), torch.from_numpy(np.array(target[rows]))
+
+
+class TorchClassifier:
+    """Wraps a trained network with a scikit-learn style 'predict_proba'."""
+
+    def __init__(self, network: nn.Module, features: list[str]) -> None:
+        """Initializes the classifier.
+
+        Args:
+            network (nn.Module): The trained network, returning one logit per row.
+            features (list[str]): The feature columns, in the order the network expects.
+        """
+        self.network = network
+        self.features = features
+
+    def predict_proba(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:  # noqa: N803
+        """Returns the probability of each class for every row.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): The feature rows.
+
+        Returns:
+            np.ndarray: An array of shape (n_rows, 2) with the probabilities of class 0 and class 1.
+        """
+        values = X[self.features] if isinstance(X, pd.DataFrame) else X
+        values = torch.tensor(np.array(values, dtype=np.float32))
+        self.network.eval()
+        with torch.inference_mode():
+            probs = torch.sigmoid(self.network(values)).squeeze(1).numpy()
+        return np.column_stack([1 - probs, probs])
+
+
+def write_memmap_arrays(X: pd.DataFrame, y: pd.Series, directory: str) -> tuple[str, str]:  # noqa: N803
+    """Writes the feature matrix and target vector to memory-mapped .npy files.
+
+    Args:
+        X (pd.DataFrame): The feature columns.
+        y (pd.Series): The binary target column.
+        directory (str): The directory where the files are written.
+
+    Returns:
+        tuple[str, str]: The paths of the feature and target files.
+    """
+    features_path = os.path.join(directory, "features.npy")
+    target_path = os.path.join(directory, "target.npy")
+
+    features = np.lib.format.open_memmap(features_path, mode="w+", dtype=np.float32, shape=X.shape)
+    features[:] = X.to_numpy(dtype=np.float32)
+    features.flush()
+    target = np.lib.format.open_memmap(target_path, mode="w+", dtype=np.float32, shape=(len(y), 1))
+    target[:, 0] = y.to_numpy(dtype=np.float32)
+    target.flush()
+    del features, target
+
+    return features_path, target_path
+
+
+def build_network(model_type: str, n_features: int, hidden_size: int = DEFAULT_HIDDEN_SIZE) -> nn.Module:
+    """Builds the network for the given model type.
+
+    Args:
+        model_type (str): "logistic" for a single linear layer, or "mlp" for one hidden ReLU layer.
+        n_features (int): The number of input features.
+        hidden_size (int, optional): The hidden layer size of the MLP. Default is DEFAULT_HIDDEN_SIZE.
+
+    Returns:
+        nn.Module: A network that returns one logit per row.
+    """
+    if model_type == "logistic":
+        return nn.Linear(n_features, 1)
+    if model_type == "mlp":
+        return nn.Sequential(nn.Linear(n_features, hidden_size), nn.ReLU(), nn.Linear(hidden_size, 1))
+    msg = f"Unknown model type '{model_type}'. Expected one of {MODEL_TYPES}."
+    raise ValueError(msg)
+
+
+def torch_regression_analysis(  # noqa: PLR0913
+    dataframe: pd.DataFrame,
+    target: str,
+    features: list[str],
+    model_type: str = "logistic",
+    epochs: int = DEFAULT_EPOCHS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    num_workers: int = 0,
+    num_threads: int | None = None,
+) -> dict:
+    """Trains a logistic regression or MLP classifier with PyTorch on the CPU.
+
+    The train/test split is the same as in 'logistic_regression_analysis', so both backends
+    are evaluated on identical test rows.
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame.
+        target (str): The name of the target column (dependent variable).
+        features (list[str]): The list of feature columns (independent variables).
+        model_type (str, optional): "logistic" or "mlp". Default is "logistic".
+        epochs (int, optional): The number of passes over the training data. Default is DEFAULT_EPOCHS.
+        batch_size (int, optional): The mini-batch size. Default is DEFAULT_BATCH_SIZE.
+        learning_rate (float, optional): The Adam learning rate. Default is DEFAULT_LEARNING_RATE.
+        num_workers (int, optional): The number of DataLoader worker processes. Default is 0.
+        num_threads (int | None, optional): The number of intra-op threads for torch during training.
+            - The previous setting is restored afterwards. None keeps torch's current setting. Default is None.
+
+    Returns:
+        dict: A dictionary containing the trained model and prediction-related data.
+    """
+    previous_threads = torch.get_num_threads()
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    try:
+        torch.manual_seed(42)
+
+        X = dataframe[features]
+        y = dataframe[target]
+
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+        network = build_network(model_type, len(features))
+        optimizer = torch.optim.Adam(network.parameters(), lr=learning_rate)
+        loss_fn = nn.BCEWithLogitsLoss()
+
+        with tempfile.TemporaryDirectory() as directory:
+            features_path, target_path = write_memmap_arrays(X_train, y_train, directory)
+            loader = DataLoader(
+                MemmapBatchDataset(features_path, target_path, batch_size),
+                batch_size=None,  # Items are already batches
+                shuffle=True,
+                num_workers=num_workers,
+                persistent_workers=num_workers > 0,
+            )
+
+            network.train()
+            for _ in range(epochs):
+                for X_batch, y_batch in loader:
+                    optimizer.zero_grad()
+                    loss = loss_fn(network(X_batch), y_batch)
+                    loss.backward()
+                    optimizer.step()
+            del loader  # Stop the workers before the files are removed
+
+        model = TorchClassifier(network, list(features))
+        y_pred_probs = model.predict_proba(X_test)[:, 1]
+    finally:
+        torch.set_num_threads(previous_threads)
+
+    return {
+        "model": model,
+        "X_test": X_test,
+        "y_test": y_test,
+        "y_pred_probs": y_pred_probs,
+    }
+
+
+def compare_training_throughput(
+    dataframe: pd.DataFrame, target: str, features: list[str], epochs: int = DEFAULT_EPOCHS, num_workers: int = 0
+) -> pd.DataFrame:
+    """Compares the training throughput of the scikit-learn and PyTorch backends.
+
+    Both backends are compared on the same basis: the time to fit, and the training rows
+    processed per second counting every full pass over the training data (one per lbfgs
+    iteration for scikit-learn, one per epoch for PyTorch).
+
+    Args:
+        dataframe (pd.DataFrame): The input DataFrame.
+        target (str): The name of the target column.
+        features (list[str]): The list of feature columns.
+        epochs (int, optional): The number of epochs for the PyTorch models. Default is DEFAULT_EPOCHS.
+        num_workers (int, optional): The number of DataLoader worker processes. Default is 0.
+
+    Returns:
+        pd.DataFrame: One row per backend with the time to fit, the passes over the data and the rows per second.
+    """
+    n_train = len(dataframe) - math.ceil(len(dataframe) * 0.2)
+    results = []
+
+    start = time.perf_counter()
+    model = logistic_regression_analysis(dataframe, target, features)["model"]
+    seconds = time.perf_counter() - start
+    results.append({"backend": "sklearn-logistic", "seconds": seconds, "passes": int(model.n_iter_.max())})
+
+    for model_type in MODEL_TYPES:
+        start = time.perf_counter()
+        torch_regression_analysis(dataframe, target, features, model_type, epochs=epochs, num_workers=num_workers)
+        seconds = time.perf_counter() - start
+        results.append({"backend": f"torch-{model_type}", "seconds": seconds, "passes": epochs})
+
+    comparison = pd.DataFrame(results)
+    comparison["rows_per_second"] = n_train * comparison["passes"] / comparison["seconds"]
+    return comparison
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Compare the scikit-learn and PyTorch training throughput.")
+    parser.add_argument("--data", default="parkinsons.data", help="Path of the raw dataset.")
+    parser.add_argument("--features", nargs="+", default=["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)"])
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=0, help="DataLoader worker processes.")
+    parser.add_argument("--threads", type=int, default=None, help="Intra-op threads for torch.")
+    parser.add_argument("--repeat", type=int, default=1, help="Replicate the rows to simulate a larger dataset.")
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+    df = pd.concat([pd.read_csv(args.data)] * args.repeat, ignore_index=True)
+    comparison = compare_training_throughput(df, "status", args.features, epochs=args.epochs, num_workers=args.workers)
+    logging.info(f"Training throughput on {len(df)} rows ({torch.get_num_threads()} torch threads):\n{comparison}")
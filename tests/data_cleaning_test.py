@@ -9,11 +9,13 @@ import sys
 
 import pandas as pd
 import pytest
+from sklearn.preprocessing import MinMaxScaler
 
 # Add the project root directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
 
 from src.data_cleaning import (
+    clean_dataset,
     encode_categorical_columns,
     normalize_columns,
     remove_missing_values,
@@ -109,6 +111,26 @@ def test_remove_outliers_no_outliers() -> None:
     pd.testing.assert_frame_equal(cleaned_df, df, check_dtype=True, check_like=True)
 
 
+def test_clean_dataset() -> None:
+    """Tests 'clean_dataset' by checking that missing values are removed and the columns are normalized.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the cleaned rows and values, the fitted scaler, and that the input DataFrame is unchanged.
+    """
+    data = {"A": [1.0, 2.0, None, 3.0], "B": [4.0, 6.0, 5.0, 8.0]}
+    df = pd.DataFrame(data)
+    scaler = MinMaxScaler()
+    cleaned_df = clean_dataset(df, ["A", "B"], scaler=scaler)
+
+    assert cleaned_df["A"].tolist() == [0.0, 0.5, 1.0], "Column 'A' was not cleaned and normalized."
+    assert cleaned_df["B"].tolist() == [0.0, 0.5, 1.0], "Column 'B' was not cleaned and normalized."
+    assert scaler.data_min_.tolist() == [1.0, 4.0], "The scaler was not fitted on the cleaned rows."
+    assert df.equals(pd.DataFrame(data)), "The input DataFrame was modified."
+
+
 def test_encode_categorical_columns() -> None:
     """Tests the 'encode_categorical_columns' function by checking that categorical columns are encoded into numeric values.
 
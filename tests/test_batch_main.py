@@ -0,0 +1,89 @@
+"""Unit tests for the batch runner in 'batch_main.py'.
+
+Run these tests with pytest:
+    pytest test_batch_main.py
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from batch_main import assign_output_dirs, discover_datasets, run_batch
+
+RAW_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "parkinsons.data")  # noqa: PTH118, PTH120
+
+
+def test_discover_datasets(tmp_path: Path) -> None:
+    """Tests that 'discover_datasets' expands globs and manifest entries without duplicates.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that every dataset is found exactly once.
+    """
+    for name in ["a.data", "b.data"]:
+        (tmp_path / name).write_text("x\n")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text(f"# nightly exports\n{tmp_path / 'a.data'}\n\n")
+
+    paths = discover_datasets([str(tmp_path / "*.data")], str(manifest))
+
+    assert [os.path.basename(path) for path in paths] == ["a.data", "b.data"]
+
+
+def test_assign_output_dirs_unique() -> None:
+    """Tests that datasets sharing a file name get distinct output directories.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the output directories do not collide.
+    """
+    output_dirs = assign_output_dirs(["x/night.data", "y/night.data"], "out")
+
+    assert output_dirs["x/night.data"] == os.path.join("out", "night")
+    assert output_dirs["y/night.data"] == os.path.join("out", "night_2")
+
+
+def test_run_batch_isolates_failures(tmp_path: Path) -> None:
+    """Tests that a failing dataset is retried and reported without affecting the others.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts the status, attempts and outputs recorded in the summary table.
+    """
+    good = tmp_path / "good.data"
+    shutil.copy(RAW_DATA_PATH, good)
+    bad = tmp_path / "bad.data"
+    bad.write_text("name,status\nphon_R01_S01_1,1\n")
+
+    summary = run_batch([str(good), str(bad)], str(tmp_path / "out"), max_workers=2, retries=1)
+
+    assert summary["status"].tolist() == ["ok", "failed"]
+    assert summary["attempts"].tolist() == [1, 2]
+    assert summary.loc[0, "rows"] > 0
+    assert os.path.isfile(tmp_path / "out" / "good" / "logistic_regression.png")
+    assert summary.attrs["datasets_per_minute"] > 0
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
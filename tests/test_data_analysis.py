@@ -121,6 +121,30 @@ def test_logistic_regression_analysis() -> None:
     assert "y_pred_probs" in result
 
 
+def test_logistic_regression_analysis_warm_start_copies_model() -> None:
+    """Tests that warm-starting from a trained model leaves that model unchanged.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that a new model is returned and the given model keeps its coefficients and settings.
+    """
+    data = {
+        "MDVP:Fo(Hz)": [0.1, 0.9, 0.2, 0.8, 0.15, 0.85, 0.3, 0.7, 0.05, 0.95],
+        "status": [0, 1, 0, 1, 0, 1, 0, 1, 0, 1],  # 0 = healthy, 1 = patient
+    }
+    df = pd.DataFrame(data)
+    model = logistic_regression_analysis(df, "status", ["MDVP:Fo(Hz)"])["model"]
+    coefficients = model.coef_.copy()
+
+    result = logistic_regression_analysis(df, "status", ["MDVP:Fo(Hz)"], random_state=0, model=model)
+
+    assert result["model"] is not model
+    assert (model.coef_ == coefficients).all()
+    assert not model.warm_start
+
+
 def test_perform_analysis() -> None:
     """Tests the 'perform_analysis' function by verifying that all analysis steps execute without errors and return results.
 
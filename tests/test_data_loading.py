@@ -0,0 +1,107 @@
+"""Unit tests for the multi-core CSV loader in the 'data_loading' module.
+
+Run these tests with pytest:
+    pytest test_data_loading.py
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.data_cleaning import remove_missing_values
+from src.data_loading import build_schema, load_raw_data, split_byte_ranges
+
+RAW_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "parkinsons.data")  # noqa: PTH118, PTH120
+
+
+def test_build_schema() -> None:
+    """Tests that the schema types the name as text, the status as nullable integer and the rest as float.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the dtype of every column.
+    """
+    schema = build_schema(["name", "MDVP:Fo(Hz)", "status"])
+
+    assert schema == {"name": "str", "MDVP:Fo(Hz)": "float64", "status": "Int64"}
+
+
+def test_split_byte_ranges_on_line_boundaries() -> None:
+    """Tests that the byte ranges cover the whole body and start at the beginning of a line.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the ranges are contiguous and aligned to lines.
+    """
+    columns, byte_ranges = split_byte_ranges(RAW_DATA_PATH, 4)
+    with open(RAW_DATA_PATH, "rb") as file:
+        content = file.read()
+
+    assert columns[0] == "name"
+    assert len(byte_ranges) == 4
+    assert byte_ranges[-1][1] == len(content)
+    for (_, end), (start, _) in zip(byte_ranges[:-1], byte_ranges[1:], strict=True):
+        assert end == start
+        assert content[start - 1 : start] == b"\n"
+
+
+def test_load_raw_data_parallel_matches_read_csv(tmp_path: Path) -> None:
+    """Tests that the parallel path returns the same rows as 'pd.read_csv'.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that both DataFrames are equal.
+    """
+    file_path = tmp_path / "parkinsons.data"
+    shutil.copy(RAW_DATA_PATH, file_path)
+
+    parallel = load_raw_data(str(file_path), max_workers=3, min_parallel_bytes=0)
+    expected = pd.read_csv(file_path)
+
+    pd.testing.assert_frame_equal(parallel, expected, check_dtype=False)
+
+
+def test_load_raw_data_parallel_keeps_missing_status(tmp_path: Path) -> None:
+    """Tests that a blank status is loaded as missing and dropped by the cleaning step, as on one core.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that both paths keep the same rows after removing missing values.
+    """
+    expected = pd.read_csv(RAW_DATA_PATH)
+    expected.loc[5, "status"] = None
+    file_path = tmp_path / "parkinsons.data"
+    expected.to_csv(file_path, index=False)
+
+    parallel = load_raw_data(str(file_path), max_workers=3, min_parallel_bytes=0)
+
+    assert parallel["status"].isna().sum() == 1
+    assert remove_missing_values(parallel)["name"].tolist() == remove_missing_values(expected)["name"].tolist()
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
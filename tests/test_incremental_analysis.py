@@ -0,0 +1,144 @@
+"""Unit tests for the incremental re-analysis in the 'incremental_analysis' module.
+
+Run these tests with pytest:
+    pytest test_incremental_analysis.py
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.incremental_analysis import (
+    compute_moments,
+    full_analysis,
+    incremental_analysis,
+    merge_moments,
+    moments_correlation,
+)
+
+RAW_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "parkinsons.data")  # noqa: PTH118, PTH120
+COLUMNS = ["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)", "MDVP:Flo(Hz)"]
+
+
+def copy_raw_data(tmp_path: Path) -> tuple[str, list[bytes]]:
+    """Copies the raw dataset to a temporary file and returns its path and data lines."""
+    file_path = str(tmp_path / "parkinsons.data")
+    shutil.copy(RAW_DATA_PATH, file_path)
+    with open(file_path, "rb") as file:
+        lines = file.readlines()[1:]
+    return file_path, lines
+
+
+def test_merge_moments_matches_direct_computation() -> None:
+    """Tests that merging the statistics of two parts equals the statistics of the whole.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the count, mean, co-moments and extremes are equal.
+    """
+    values = np.random.default_rng(0).normal(size=(50, 3))
+    merged = merge_moments(compute_moments(values[:20]), compute_moments(values[20:]))
+    expected = compute_moments(values)
+
+    assert merged["n"] == expected["n"]
+    for key in ["mean", "comoment", "min", "max"]:
+        np.testing.assert_allclose(merged[key], expected[key])
+    np.testing.assert_allclose(moments_correlation(merged, ["a", "b", "c"]), np.corrcoef(values.T))
+
+
+def test_incremental_analysis_reads_only_the_tail(tmp_path: Path) -> None:
+    """Tests that appended rows within the bounds are merged into the stored statistics.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts the updated offset, row count, statistics and regression data.
+    """
+    file_path, lines = copy_raw_data(tmp_path)
+    data, state, _ = full_analysis(file_path, COLUMNS, "status", ["MDVP:Fo(Hz)"])
+
+    with open(file_path, "ab") as file:
+        file.writelines(lines[:10])
+    update = incremental_analysis(state, file_path)
+
+    assert update is not None
+    new_rows, new_state, regression_results = update
+    assert new_state["byte_offset"] == os.path.getsize(file_path)
+    assert new_state["row_count"] == state["row_count"] + 10
+    assert new_state["moments"]["n"] == len(data) + len(new_rows)
+    assert len(new_state["regression_data"]) == len(data) + len(new_rows)
+    assert "y_pred_probs" in regression_results
+    assert new_state["model"] is not state["model"]  # The input state keeps its model
+
+
+def test_incremental_analysis_without_new_rows(tmp_path: Path) -> None:
+    """Tests that a rerun with nothing appended keeps the stored state and model.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that the second update returns no rows, the same model and the same predictions.
+    """
+    file_path, lines = copy_raw_data(tmp_path)
+    _, state, _ = full_analysis(file_path, COLUMNS, "status", ["MDVP:Fo(Hz)"])
+    with open(file_path, "ab") as file:
+        file.writelines(lines[:20])
+    update = incremental_analysis(state, file_path)
+    assert update is not None
+    _, state, regression_results = update
+
+    rerun = incremental_analysis(state, file_path)
+
+    assert rerun is not None
+    new_rows, new_state, rerun_results = rerun
+    assert len(new_rows) == 0
+    assert new_state["byte_offset"] == state["byte_offset"]
+    assert rerun_results["model"] is state["model"]
+    np.testing.assert_allclose(rerun_results["y_pred_probs"], regression_results["y_pred_probs"])
+
+
+def test_incremental_analysis_requires_full_recompute(tmp_path: Path) -> None:
+    """Tests that a new row outside the Min-Max bounds, or a rewritten file, triggers a full recompute.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that 'incremental_analysis' returns None.
+    """
+    file_path, lines = copy_raw_data(tmp_path)
+    _, state, _ = full_analysis(file_path, COLUMNS, "status", ["MDVP:Fo(Hz)"])
+
+    fields = lines[0].decode().split(",")
+    fields[1] = "1000.0"  # Far above the largest MDVP:Fo(Hz)
+    with open(file_path, "ab") as file:
+        file.write(",".join(fields).encode())
+    assert incremental_analysis(state, file_path) is None
+
+    with open(file_path, "wb") as file:
+        file.writelines(lines[:5])
+    assert incremental_analysis(state, file_path) is None
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
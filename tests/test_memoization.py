@@ -0,0 +1,119 @@
+"""Unit tests for the result store and memoized functions in the 'memoization' module.
+
+Run these tests with pytest:
+    pytest test_memoization.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.memoization import MemoStore, cached_logistic_regression_analysis, fingerprint_dataframe
+
+
+def make_dataframe() -> pd.DataFrame:
+    """Returns a small DataFrame with a binary 'status' column that depends on one feature."""
+    rng = np.random.default_rng(0)
+    feature = rng.normal(size=200)
+    return pd.DataFrame(
+        {"feature": feature, "other": rng.normal(size=200), "status": (feature + rng.normal(size=200) > 0).astype(int)}
+    )
+
+
+def test_fingerprint_dataframe() -> None:
+    """Tests that the fingerprint changes with the values of the selected columns only.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts which changes alter the fingerprint.
+    """
+    data = make_dataframe()
+    changed = data.copy()
+    changed.loc[0, "other"] += 1
+
+    assert fingerprint_dataframe(data) == fingerprint_dataframe(data.copy())
+    assert fingerprint_dataframe(data) != fingerprint_dataframe(changed)
+    assert fingerprint_dataframe(data, ["feature", "status"]) == fingerprint_dataframe(changed, ["feature", "status"])
+
+
+def test_cached_logistic_regression_analysis(tmp_path: Path) -> None:
+    """Tests the memory hits, the disk hits after a restart, and the misses on new parameters.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts the hit and miss counters and the returned results.
+    """
+    data = make_dataframe()
+    store = MemoStore(cache_dir=str(tmp_path))
+
+    first = cached_logistic_regression_analysis(data, "status", ["feature"], store=store)
+    second = cached_logistic_regression_analysis(data.copy(), "status", ["feature"], store=store)
+    cached_logistic_regression_analysis(data, "status", ["feature"], random_state=0, store=store)
+    assert second is first
+    assert store.stats() == {"memory_hits": 1, "disk_hits": 0, "misses": 2, "hit_rate": pytest.approx(1 / 3)}
+
+    restarted = MemoStore(cache_dir=str(tmp_path))
+    reloaded = cached_logistic_regression_analysis(data, "status", ["feature"], store=restarted)
+    assert restarted.stats()["disk_hits"] == 1
+    np.testing.assert_allclose(reloaded["y_pred_probs"], first["y_pred_probs"])
+
+
+def test_memo_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Tests that the in-memory and on-disk stores stay within their bounds.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts which keys remain after eviction.
+    """
+    store = MemoStore(cache_dir=str(tmp_path), max_memory_entries=2, max_disk_bytes=2500)
+    for key in ["a", "b", "c"]:
+        store.put(key, bytes(1000))
+        os.utime(tmp_path / f"{key}.pkl", (ord(key), ord(key)))  # Distinct modification times
+
+    assert list(store.memory) == ["b", "c"]
+    assert sorted(os.listdir(tmp_path)) == ["b.pkl", "c.pkl"]
+    assert store.get("a") == (False, None)
+
+
+@pytest.mark.parametrize("content", [b"cbuiltins\nno_such_name\n.", b"cno_such_module\nname\n.", b"\x80"])
+def test_memo_store_discards_unreadable_results(tmp_path: Path, content: bytes) -> None:
+    """Tests that a stored result that cannot be unpickled is a miss and is deleted.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+        content (bytes): A pickle referring to a missing attribute or module, or a truncated pickle.
+
+    Returns:
+        None: Asserts the miss and that the file was removed.
+    """
+    (tmp_path / "key.pkl").write_bytes(content)
+    store = MemoStore(cache_dir=str(tmp_path))
+
+    assert store.get("key") == (False, None)
+    assert not (tmp_path / "key.pkl").exists()
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
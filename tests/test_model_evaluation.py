@@ -0,0 +1,136 @@
+"""Unit tests for the evaluation functions in the 'model_evaluation' module.
+
+Run these tests with pytest:
+    pytest test_model_evaluation.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from sklearn.metrics import average_precision_score, roc_auc_score, roc_curve
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.model_evaluation import (
+    bootstrap_confidence_intervals,
+    calibration_bins,
+    evaluate_predictions,
+    precision_recall_points,
+    roc_curve_points,
+)
+
+
+def make_predictions() -> tuple[np.ndarray, np.ndarray]:
+    """Returns random labels and rounded scores, so that some scores are tied."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 500)
+    y_score = np.round(np.clip(rng.normal(0.4 + 0.2 * y_true, 0.2), 0, 1), 2)
+    return y_true, y_score
+
+
+def test_roc_and_precision_recall_match_sklearn() -> None:
+    """Tests that the ROC curve, AUC and average precision equal the scikit-learn results.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the curves and summary values match.
+    """
+    y_true, y_score = make_predictions()
+    roc = roc_curve_points(y_true, y_score)
+    expected_fpr, expected_tpr, _ = roc_curve(y_true, y_score, drop_intermediate=False)
+
+    np.testing.assert_allclose(roc["fpr"], expected_fpr)
+    np.testing.assert_allclose(roc["tpr"], expected_tpr)
+    assert roc["auc"] == pytest.approx(roc_auc_score(y_true, y_score))
+    assert precision_recall_points(y_true, y_score)["average_precision"] == pytest.approx(
+        average_precision_score(y_true, y_score)
+    )
+
+
+def test_calibration_bins() -> None:
+    """Tests the counts, means and observed rates of the calibration bins.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the values of the two non-empty bins.
+    """
+    result = calibration_bins(np.array([0, 1, 1, 1]), np.array([0.1, 0.15, 0.9, 1.0]), n_bins=10)
+
+    assert result["counts"].tolist() == [2, 2]
+    np.testing.assert_allclose(result["mean_predicted"], [0.125, 0.95])
+    np.testing.assert_allclose(result["fraction_positive"], [0.5, 1.0])
+
+
+def test_bootstrap_confidence_intervals_contain_estimate() -> None:
+    """Tests that the bootstrap intervals are ordered and contain the point estimates.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the bounds of the AUC and average precision intervals.
+    """
+    y_true, y_score = make_predictions()
+    intervals = bootstrap_confidence_intervals(y_true, y_score, n_bootstrap=200)
+
+    lower, upper = intervals["auc"]
+    assert lower < roc_auc_score(y_true, y_score) < upper
+    lower, upper = intervals["average_precision"]
+    assert lower < average_precision_score(y_true, y_score) < upper
+
+
+def test_single_class_and_empty_labels_are_rejected() -> None:
+    """Tests that metrics which are undefined for the given labels raise a clear ValueError.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the raised errors, and that the metrics that are defined still work.
+    """
+    scores = np.array([0.2, 0.4, 0.9])
+
+    with pytest.raises(ValueError, match="no positive class"):
+        precision_recall_points(np.zeros(3), scores)
+    with pytest.raises(ValueError, match="no negative class"):
+        roc_curve_points(np.ones(3), scores)
+    with pytest.raises(ValueError, match="No predictions"):
+        evaluate_predictions({"y_test": np.array([]), "y_pred_probs": np.array([])}, n_bootstrap=0)
+    assert precision_recall_points(np.ones(3), scores)["average_precision"] == pytest.approx(1.0)
+    assert calibration_bins(np.zeros(3), scores)["counts"].sum() == 3
+
+
+def test_evaluate_predictions() -> None:
+    """Tests that 'evaluate_predictions' accepts the result dictionary of a regression analysis.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that all evaluations are returned.
+    """
+    y_true, y_score = make_predictions()
+    evaluation = evaluate_predictions({"y_test": y_true, "y_pred_probs": y_score}, n_bootstrap=0)
+
+    assert set(evaluation) == {"roc", "precision_recall", "calibration", "confidence_intervals"}
+    assert evaluation["confidence_intervals"] is None
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
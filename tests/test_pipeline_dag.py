@@ -0,0 +1,112 @@
+"""Unit tests for the pipeline DAG and its scheduler in the 'pipeline_dag' module.
+
+Run these tests with pytest:
+    pytest test_pipeline_dag.py
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.pipeline_dag import load_pipeline_config, run_dag, topological_order
+
+PROJECT_DIR = os.path.join(os.path.dirname(__file__), "..")  # noqa: PTH118, PTH120
+
+
+def make_value(value: int) -> int:
+    """Returns the value after a short pause."""
+    time.sleep(0.2)
+    return value
+
+
+def add(left: int, right: int) -> int:
+    """Returns the sum of two stage results."""
+    return left + right
+
+
+TASKS: dict[str, Callable] = {"make_value": make_value, "add": add}
+STAGES = {
+    "a": {"task": "make_value", "params": {"value": 1}},
+    "b": {"task": "make_value", "params": {"value": 2}, "executor": "process"},
+    "total": {"task": "add", "inputs": {"left": "a", "right": "b"}},
+}
+
+
+def test_topological_order_rejects_cycles() -> None:
+    """Tests that the stages are ordered after their inputs, and that cycles and unknown tasks are rejected.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the order and the raised errors.
+    """
+    assert topological_order(STAGES, TASKS) == ["a", "b", "total"]
+
+    cycle = {"x": {"task": "add", "inputs": {"left": "y"}}, "y": {"task": "add", "inputs": {"left": "x"}}}
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order(cycle, TASKS)
+    with pytest.raises(ValueError, match="unknown task"):
+        topological_order({"x": {"task": "missing"}}, TASKS)
+
+
+def test_run_dag_runs_independent_stages_concurrently() -> None:
+    """Tests that independent stages overlap in time and that results flow to dependent stages.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the results, the overlap and the critical path.
+    """
+    artifacts, report = run_dag(STAGES, max_workers=2, tasks=TASKS)
+
+    assert artifacts["total"] == 3
+    timings = report.set_index("stage")
+    assert timings.loc["a", "start"] < timings.loc["b", "end"]
+    assert timings.loc["b", "start"] < timings.loc["a", "end"]
+    assert report.attrs["critical_path"][-1] == "total"
+    assert timings.loc["total", "critical"]
+
+
+def test_default_pipeline_config(tmp_path: Path) -> None:
+    """Tests that the default pipeline configuration runs end to end and saves every plot.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts that the plots and the regression results are produced.
+    """
+    config = load_pipeline_config(os.path.join(PROJECT_DIR, "pipeline.toml"))  # noqa: PTH118
+    config["settings"]["output_dir"] = str(tmp_path)
+    config["stages"]["load"]["params"]["file_path"] = os.path.join(PROJECT_DIR, "parkinsons.data")  # noqa: PTH118
+    config["stages"]["save_cleaned"]["params"]["file_path"] = str(tmp_path / "cleaned_data.csv")
+
+    artifacts, report = run_dag(config["stages"], config["settings"], config["max_workers"])
+
+    assert "y_pred_probs" in artifacts["regression"]
+    assert len(report) == len(config["stages"])
+    assert os.path.isfile(tmp_path / "logistic_regression.png")
+    assert artifacts["save_analysis"] == os.path.join(tmp_path, "analysis_results.txt")  # noqa: PTH118
+    assert len(artifacts["group_plots"]) == 3
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
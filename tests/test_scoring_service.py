@@ -0,0 +1,158 @@
+"""Unit tests for the scoring service in the 'scoring_service' module.
+
+Run these tests with pytest:
+    pytest test_scoring_service.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.scoring_service import MicroBatcher, ScoringService, score_rows, train_scoring_artifacts
+
+FEATURES = ["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)"]
+
+
+def make_artifacts() -> dict:
+    """Trains scoring artifacts on a small synthetic dataset."""
+    rng = np.random.default_rng(0)
+    status = np.tile([0, 1], 20)
+    data = {
+        "MDVP:Fo(Hz)": 120 + 30 * status + rng.normal(0, 10, 40),
+        "MDVP:Fhi(Hz)": 150 + rng.normal(0, 10, 40),
+        "MDVP:Flo(Hz)": 100 + rng.normal(0, 10, 40),
+        "status": status,
+    }
+    return train_scoring_artifacts(pd.DataFrame(data), FEATURES)
+
+
+def test_score_rows_matches_model() -> None:
+    """Tests that 'score_rows' applies the fitted normalization before scoring with the model.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the scores equal the model's probabilities on the normalized rows.
+    """
+    artifacts = make_artifacts()
+    rows = np.array([[119.992, 157.302], [160.0, 140.0]])
+
+    raw = pd.DataFrame(rows, columns=FEATURES)
+    raw["MDVP:Flo(Hz)"] = 100.0
+    normalized = artifacts["scaler"].transform(raw[artifacts["normalized_columns"]])
+    normalized = pd.DataFrame(normalized, columns=artifacts["normalized_columns"])[FEATURES]
+    expected = artifacts["model"].predict_proba(normalized)[:, 1]
+
+    np.testing.assert_allclose(score_rows(artifacts, rows), expected)
+
+
+def test_micro_batcher_groups_concurrent_rows() -> None:
+    """Tests that concurrently submitted rows are scored together in one batch.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that all rows are scored and grouped into a single batch.
+    """
+    artifacts = make_artifacts()
+
+    async def run() -> tuple[list[float], list[int]]:
+        batcher = MicroBatcher(artifacts, max_batch_size=16, max_delay_ms=50)
+        batcher.start()
+        scores = await asyncio.gather(*(batcher.score(np.array([120.0 + i, 150.0])) for i in range(10)))
+        await batcher.stop()
+        return scores, list(batcher.batch_sizes)
+
+    scores, batch_sizes = asyncio.run(run())
+
+    assert len(scores) == 10
+    assert all(0 <= score <= 1 for score in scores)
+    assert batch_sizes == [10]
+
+
+def test_micro_batcher_isolates_failing_rows() -> None:
+    """Tests that a row that cannot be scored fails only its own request, not the rest of its batch.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the valid rows are scored and the invalid row raises.
+    """
+    artifacts = make_artifacts()
+
+    async def run() -> list:
+        batcher = MicroBatcher(artifacts, max_batch_size=16, max_delay_ms=50)
+        batcher.start()
+        rows = [np.array([120.0, 150.0]), np.array([np.nan, 150.0]), np.array([150.0, 150.0])]
+        results = await asyncio.gather(*(batcher.score(row) for row in rows), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+
+    assert 0 <= results[0] <= 1
+    assert isinstance(results[1], ValueError)
+    assert 0 <= results[2] <= 1
+
+
+def test_scoring_service_http() -> None:
+    """Tests the /score and /metrics endpoints of the service over a local connection.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that scores and latency metrics are returned, and that non-finite rows are rejected.
+    """
+    artifacts = make_artifacts()
+
+    async def request(port: int, method: str, path: str, payload: dict | None = None) -> dict:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode())
+        writer.write(body)
+        response = await reader.read()
+        writer.close()
+        return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+    async def run() -> tuple[dict, dict, dict]:
+        service = ScoringService(artifacts, max_delay_ms=1)
+        port = await service.start(port=0)
+        row = {"MDVP:Fo(Hz)": 119.992, "MDVP:Fhi(Hz)": 157.302}
+        scored = await request(port, "POST", "/score", {"rows": [row, row]})
+        rejected = await request(port, "POST", "/score", {"rows": [{**row, "MDVP:Fo(Hz)": float("nan")}]})
+        metrics = await request(port, "GET", "/metrics")
+        await service.stop()
+        return scored, rejected, metrics
+
+    scored, rejected, metrics = asyncio.run(run())
+
+    assert len(scored["scores"]) == 2
+    assert scored["scores"][0] == scored["scores"][1]
+    assert "non-finite" in rejected["error"]
+    assert metrics["requests"] == 2
+    assert metrics["p99_ms"] >= metrics["p50_ms"] > 0
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
@@ -0,0 +1,108 @@
+"""Unit tests for the subject index functions in the 'subject_index' module.
+
+Run these tests with pytest:
+    pytest test_subject_index.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.subject_index import (
+    aggregate_by_subject,
+    build_subject_index,
+    parse_subject_ids,
+    subject_rows,
+    subject_train_test_split,
+)
+
+DATA = {
+    "name": ["phon_R01_S02_1", "phon_R01_S01_1", "phon_R01_S02_2", "phon_R01_S10_1", "phon_R01_S01_2"],
+    "MDVP:Fo(Hz)": [200.0, 119.992, 210.0, 150.0, 122.4],
+    "status": [0, 1, 0, 1, 1],
+}
+
+
+def test_parse_subject_ids() -> None:
+    """Tests that subject IDs are parsed from the recording names, and bad names are rejected.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the parsed IDs and the error for an unparsable name.
+    """
+    assert parse_subject_ids(pd.Series(DATA["name"])).tolist() == [2, 1, 2, 10, 1]
+    with pytest.raises(ValueError, match="Cannot parse"):
+        parse_subject_ids(pd.Series(["recording_1"]))
+
+
+def test_build_subject_index_and_rows() -> None:
+    """Tests the CSR offsets of the index and the per-subject row lookup.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that every subject maps to its own rows.
+    """
+    index = build_subject_index(pd.DataFrame(DATA))
+
+    assert index["subject_ids"].tolist() == [1, 2, 10]
+    assert index["offsets"].tolist() == [0, 2, 4, 5]
+    assert subject_rows(index, 1).tolist() == [1, 4]
+    assert subject_rows(index, 2).tolist() == [0, 2]
+    assert subject_rows(index, 10).tolist() == [3]
+
+
+def test_aggregate_by_subject() -> None:
+    """Tests that the per-subject statistics match a pandas groupby.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts the counts, means and standard deviations.
+    """
+    df = pd.DataFrame(DATA)
+    result = aggregate_by_subject(df, build_subject_index(df))
+
+    expected = df.groupby(parse_subject_ids(df["name"]))["MDVP:Fo(Hz)"].agg(["mean", "std"])
+    assert result["n_recordings"].tolist() == [2, 2, 1]
+    np.testing.assert_allclose(result["MDVP:Fo(Hz)_mean"], expected["mean"])
+    np.testing.assert_allclose(result["MDVP:Fo(Hz)_std"], expected["std"])
+
+
+def test_subject_train_test_split() -> None:
+    """Tests that no subject appears in both the train and the test set.
+
+    Args:
+        None
+
+    Returns:
+        None: Asserts that the sets are disjoint by subject and cover every row.
+    """
+    df = pd.DataFrame(DATA)
+    train, test = subject_train_test_split(df, build_subject_index(df), test_size=0.34)
+
+    assert len(train) + len(test) == len(df)
+    assert not set(parse_subject_ids(train["name"])) & set(parse_subject_ids(test["name"]))
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()
@@ -0,0 +1,84 @@
+"""Unit tests for the PyTorch training functions in the 'torch_training' module.
+
+Run these tests with pytest:
+    pytest test_torch_training.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # noqa: PTH100, PTH118, PTH120
+
+from src.data_analysis import logistic_regression_analysis
+from src.torch_training import MemmapBatchDataset, torch_regression_analysis, write_memmap_arrays
+
+DATA = {
+    "MDVP:Fo(Hz)": [0.1, 0.9, 0.2, 0.8, 0.15, 0.85, 0.3, 0.7, 0.05, 0.95],
+    "MDVP:Fhi(Hz)": [0.2, 0.6, 0.3, 0.7, 0.25, 0.65, 0.2, 0.8, 0.1, 0.9],
+    "status": [0, 1, 0, 1, 0, 1, 0, 1, 0, 1],  # 0 = healthy, 1 = patient
+}
+
+
+def test_memmap_batch_dataset(tmp_path: Path) -> None:
+    """Tests that the memory-mapped batches cover every row exactly once.
+
+    Args:
+        tmp_path: The pytest temporary directory fixture.
+
+    Returns:
+        None: Asserts the number of batches and their concatenated contents.
+    """
+    df = pd.DataFrame(DATA)
+    features_path, target_path = write_memmap_arrays(df[["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)"]], df["status"], str(tmp_path))
+    dataset = MemmapBatchDataset(features_path, target_path, batch_size=4)
+
+    batches = [dataset[i] for i in range(len(dataset))]
+
+    assert len(dataset) == 3
+    np.testing.assert_allclose(np.vstack([X for X, _ in batches])[:, 0], np.array(DATA["MDVP:Fo(Hz)"]), rtol=1e-6)
+    assert np.concatenate([y for _, y in batches])[:, 0].tolist() == DATA["status"]
+
+
+@pytest.mark.parametrize("model_type", ["logistic", "mlp"])
+def test_torch_regression_analysis(model_type: str) -> None:
+    """Tests that the PyTorch backend returns the same result shape as the scikit-learn path.
+
+    Args:
+        model_type (str): The PyTorch model to train.
+
+    Returns:
+        None: Asserts the result keys, the test split, the predicted probabilities and the restored threads.
+    """
+    df = pd.DataFrame(DATA)
+    features = ["MDVP:Fo(Hz)", "MDVP:Fhi(Hz)"]
+    threads = torch.get_num_threads()
+    result = torch_regression_analysis(
+        df, "status", features, model_type=model_type, epochs=50, batch_size=4, num_threads=threads + 1
+    )
+    expected = logistic_regression_analysis(df, "status", features)
+
+    assert set(result) == {"model", "X_test", "y_test", "y_pred_probs"}
+    pd.testing.assert_frame_equal(result["X_test"], expected["X_test"])
+    assert result["y_pred_probs"].shape == expected["y_pred_probs"].shape
+    assert ((result["y_pred_probs"] > 0.5) == result["y_test"].to_numpy().astype(bool)).all()
+    assert torch.get_num_threads() == threads
+
+
+if __name__ == "__main__":
+    """
+    Main entry point for running the tests.
+
+    Args:
+        None
+
+    Returns:
+        None: Executes all tests using pytest and prints the validation results.
+    """
+    pytest.main()